@@ -89,10 +89,10 @@ ALWAYS translate statistical output into plain language:
 - chi_square_association, chi_square_goodness
 
 ### Correlation & Regression
-- correlation, simple_regression, multiple_regression, logistic_regression
+- correlation, simple_regression, simple_regression_batch, multiple_regression, logistic_regression
 
 ### SPC (Statistical Process Control)
-- i_mr_chart, xbar_r_chart, p_chart, np_chart, c_chart, u_chart
+- i_mr_chart, i_mr_chart_batch, xbar_r_chart, p_chart, np_chart, c_chart, u_chart
 
 ### Capability
 - capability_normal, capability_nonnormal
@@ -24,6 +24,7 @@ from app.services.event_bus import init_event_bus
 from app.services.file_storage import init_file_storage
 from app.services.workflow_chains import register_workflow_chains
 from app.services.ws_manager import init_ws_manager
+from app.stats.pool import shutdown_process_pool
 
 # ---------------------------------------------------------------------------
 # Application state — shared singletons
@@ -77,6 +78,7 @@ async def lifespan(app: FastAPI):
     yield  # ---------- app is running ----------
 
     # Shutdown
+    shutdown_process_pool()
     await engine.dispose()
     print("[shutdown] Resources released")
 
@@ -50,11 +50,13 @@ _TEST_REGISTRY: dict[str, tuple[TestFunction, str]] = {
     # Correlation & Regression
     "correlation": (regression.correlation, "correlation"),
     "simple_regression": (regression.simple_regression, "regression"),
+    "simple_regression_batch": (regression.simple_regression_batch, "regression"),
     "multiple_regression": (regression.multiple_regression, "regression"),
     "logistic_regression": (regression.logistic_regression, "regression"),
 
     # SPC
     "i_mr_chart": (spc.i_mr_chart, "spc"),
+    "i_mr_chart_batch": (spc.i_mr_chart_batch, "spc"),
     "xbar_r_chart": (spc.xbar_r_chart, "spc"),
     "p_chart": (spc.p_chart, "spc"),
     "np_chart": (spc.np_chart, "spc"),
@@ -151,6 +153,16 @@ TEST_CATALOG: dict[str, dict] = {
         "required_config": ["y_column", "x_column"],
         "optional_config": ["alpha"],
     },
+    "simple_regression_batch": {
+        "name": "Simple Linear Regression (per predictor)",
+        "category": "regression",
+        "description": "Separate single-predictor regressions of one response on each of several predictors",
+        "y_type": "continuous",
+        "x_type": "continuous (multiple)",
+        "min_samples": 3,
+        "required_config": ["y_column", "x_columns"],
+        "optional_config": ["alpha"],
+    },
     "two_way_anova": {
         "name": "Two-Way ANOVA",
         "category": "comparison",
@@ -221,7 +233,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": "continuous",
         "min_samples": 3,
         "required_config": ["y_column", "x_column"],
-        "optional_config": ["alpha"],
+        "optional_config": ["alpha", "include_charts"],
     },
     "multiple_regression": {
         "name": "Multiple Linear Regression",
@@ -231,7 +243,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": "continuous (multiple)",
         "min_samples": 10,
         "required_config": ["y_column", "x_columns"],
-        "optional_config": ["alpha"],
+        "optional_config": ["alpha", "include_charts"],
     },
     "logistic_regression": {
         "name": "Logistic Regression",
@@ -241,7 +253,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": "continuous or categorical",
         "min_samples": 20,
         "required_config": ["y_column", "x_columns"],
-        "optional_config": ["alpha"],
+        "optional_config": ["alpha", "fast_path"],
     },
 
     # SPC
@@ -253,7 +265,17 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": None,
         "min_samples": 2,
         "required_config": ["column"],
-        "optional_config": ["labels_column"],
+        "optional_config": ["labels_column", "include_series", "include_charts"],
+    },
+    "i_mr_chart_batch": {
+        "name": "I-MR Control Charts (per column)",
+        "category": "spc",
+        "description": "Individuals and Moving Range limits for several measurement columns at once",
+        "y_type": "continuous (time-ordered, multiple)",
+        "x_type": None,
+        "min_samples": 2,
+        "required_config": ["columns"],
+        "optional_config": ["include_charts"],
     },
     "xbar_r_chart": {
         "name": "X-bar/R Control Chart",
@@ -263,7 +285,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": None,
         "min_samples": 4,
         "required_config": ["column", "subgroup_size"],
-        "optional_config": ["columns", "labels_column"],
+        "optional_config": ["columns", "labels_column", "include_series", "include_charts"],
     },
     "p_chart": {
         "name": "P Chart",
@@ -273,7 +295,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": None,
         "min_samples": 2,
         "required_config": ["defects_column"],
-        "optional_config": ["sample_size_column", "sample_size"],
+        "optional_config": ["sample_size_column", "sample_size", "include_series", "include_charts"],
     },
     "np_chart": {
         "name": "NP Chart",
@@ -283,7 +305,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": None,
         "min_samples": 2,
         "required_config": ["defects_column", "sample_size"],
-        "optional_config": [],
+        "optional_config": ["include_series", "include_charts"],
     },
     "c_chart": {
         "name": "C Chart",
@@ -293,7 +315,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": None,
         "min_samples": 2,
         "required_config": ["column"],
-        "optional_config": [],
+        "optional_config": ["include_series", "include_charts"],
     },
     "u_chart": {
         "name": "U Chart",
@@ -303,7 +325,7 @@ TEST_CATALOG: dict[str, dict] = {
         "x_type": None,
         "min_samples": 2,
         "required_config": ["defects_column"],
-        "optional_config": ["units_column", "units"],
+        "optional_config": ["units_column", "units", "include_series", "include_charts"],
     },
 
     # Capability
@@ -64,7 +64,7 @@ def _base_layout(**overrides) -> dict:
 # ---------------------------------------------------------------------------
 
 def histogram(
-    values: Sequence[float],
+    values: Sequence[float] | np.ndarray,
     name: str = "Data",
     title: str = "Histogram",
     xaxis_title: str = "",
@@ -72,9 +72,11 @@ def histogram(
     show_normal_curve: bool = False,
 ) -> PlotlyChart:
     """Histogram with optional normal overlay."""
+    # Accept ndarrays as-is; a single C-level tolist() yields the JSON-safe trace
+    arr = np.asarray(values, dtype=float)
     data: list[dict] = [{
         "type": "histogram",
-        "x": list(values),
+        "x": arr.tolist(),
         "name": name,
         "marker": {"color": COLORS["primary"], "line": {"color": "#1E3A5F", "width": 1}},
         "opacity": 0.85,
@@ -82,8 +84,7 @@ def histogram(
     if nbins:
         data[0]["nbinsx"] = nbins
 
-    if show_normal_curve and len(values) > 2:
-        arr = np.array(values, dtype=float)
+    if show_normal_curve and len(arr) > 2:
         arr = arr[~np.isnan(arr)]
         if len(arr) > 2:
             mu, sigma = float(np.mean(arr)), float(np.std(arr, ddof=1))
@@ -116,12 +117,68 @@ def histogram(
     )
 
 
+def histogram_prebinned(
+    edges: np.ndarray,
+    counts: np.ndarray,
+    name: str = "Data",
+    title: str = "Histogram",
+    xaxis_title: str = "",
+    normal_params: tuple[float, float] | None = None,
+) -> PlotlyChart:
+    """
+    Histogram from counts already binned server-side (e.g. by np.histogram).
+
+    Ships one bar per bin instead of every raw value, so the payload is
+    O(bins) rather than O(n). normal_params=(mean, std) overlays a normal
+    curve scaled to the binned area.
+    """
+    edges = np.asarray(edges, dtype=float)
+    counts = np.asarray(counts)
+    widths = np.diff(edges)
+    data: list[dict] = [{
+        "type": "bar",
+        "x": (edges[:-1] + widths / 2).tolist(),
+        "y": counts.tolist(),
+        "width": widths.tolist(),
+        "name": name,
+        "marker": {"color": COLORS["primary"], "line": {"color": "#1E3A5F", "width": 1}},
+        "opacity": 0.85,
+    }]
+
+    if normal_params is not None:
+        mu, sigma = normal_params
+        if sigma > 0:
+            from scipy.stats import norm
+            x_range = np.linspace(mu - 4 * sigma, mu + 4 * sigma, 200)
+            y_scaled = norm.pdf(x_range, mu, sigma) * counts.sum() * widths.mean()
+            data.append({
+                "type": "scatter",
+                "x": x_range.tolist(),
+                "y": y_scaled.tolist(),
+                "mode": "lines",
+                "name": "Normal Curve",
+                "line": {"color": COLORS["danger"], "width": 2, "dash": "dash"},
+            })
+
+    return PlotlyChart(
+        chart_type="histogram",
+        data=data,
+        layout=_base_layout(
+            title={"text": title},
+            xaxis={"title": xaxis_title, "gridcolor": "#374151"},
+            yaxis={"title": "Frequency", "gridcolor": "#374151"},
+            bargap=0,
+        ),
+        title=title,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Box Plot
 # ---------------------------------------------------------------------------
 
 def box_plot(
-    data_groups: dict[str, Sequence[float]],
+    data_groups: dict[str, Sequence[float] | np.ndarray],
     title: str = "Box Plot",
     yaxis_title: str = "Value",
 ) -> PlotlyChart:
@@ -130,7 +187,7 @@ def box_plot(
     for i, (group_name, values) in enumerate(data_groups.items()):
         traces.append({
             "type": "box",
-            "y": list(values),
+            "y": np.asarray(values, dtype=float).tolist(),
             "name": group_name,
             "marker": {"color": PALETTE[i % len(PALETTE)]},
             "boxmean": "sd",
@@ -311,15 +368,14 @@ def pareto_chart(
 # ---------------------------------------------------------------------------
 
 def probability_plot(
-    values: Sequence[float],
+    values: Sequence[float] | np.ndarray,
     title: str = "Normal Probability Plot",
 ) -> PlotlyChart:
     """Q-Q plot against normal distribution."""
     from scipy import stats
 
-    arr = np.array(values, dtype=float)
-    arr = arr[~np.isnan(arr)]
-    arr_sorted = np.sort(arr)
+    arr = np.asarray(values, dtype=float)
+    arr_sorted = np.sort(arr[~np.isnan(arr)])
     n = len(arr_sorted)
     theoretical = stats.norm.ppf(np.arange(1, n + 1) / (n + 1))
 
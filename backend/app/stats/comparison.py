@@ -3,6 +3,7 @@ Comparison tests — parametric and non-parametric group comparisons.
 
 Tests:
   - one_sample_t: Compare sample mean to a known value
+    (one_sample_t_batch runs it over many columns in one vectorized pass)
   - two_sample_t: Compare means of two independent groups
   - paired_t: Compare means of paired observations
   - one_way_anova: Compare means across 3+ groups
@@ -15,12 +16,38 @@ Tests:
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Sequence
+
 import numpy as np
 import pandas as pd
 from scipy import stats as sp_stats
+from scipy.special import stdtrit
 
 from app.stats import AnalysisResult, PlotlyChart
 from app.stats import charts
+from app.stats.doe import factorial_anova
+
+
+@lru_cache()
+def _statsmodels():
+    """Import statsmodels on first use and hand back the cached handles afterwards."""
+    import statsmodels.api as sm
+    from statsmodels.formula.api import ols
+    from statsmodels.stats.multicomp import pairwise_tukeyhsd
+    return sm, ols, pairwise_tukeyhsd
+
+
+# Largest n1 * n2 for which Mann-Whitney uses the exact U distribution
+_MW_EXACT_MAX_PAIRS = 400
+
+# two_sample_t skips Levene's test when both groups have at least this many
+# observations, sizes are within 10% of each other, and the variance ratio is
+# below the cap. With (near-)equal sizes the pooled and Welch statistics
+# coincide, so the pooled t-test is robust there; unequal sizes are not
+_LEVENE_SKIP_MIN_N = 30
+_LEVENE_SKIP_MAX_SIZE_RATIO = 1.1
+_LEVENE_SKIP_MAX_VAR_RATIO = 4.0
 
 
 def _check_normality(arr: np.ndarray, name: str, warnings: list[str]) -> bool:
@@ -37,14 +64,48 @@ def _check_normality(arr: np.ndarray, name: str, warnings: list[str]) -> bool:
     return True
 
 
+def _f64(series: pd.Series) -> np.ndarray:
+    """Float64, C-contiguous view of a Series — copies only when the dtype or layout requires it."""
+    arr = series.to_numpy(dtype=np.float64, copy=False)
+    return arr if arr.flags.c_contiguous else np.ascontiguousarray(arr)
+
+
+def _mean_ss(arr: np.ndarray) -> tuple[float, float]:
+    """Mean and sum of squared deviations in one mean pass plus one dot product."""
+    mean = float(arr.mean())
+    dev = arr - mean
+    return mean, float(np.dot(dev, dev))
+
+
 def _cohen_d(group1: np.ndarray, group2: np.ndarray) -> float:
     """Cohen's d effect size for two groups."""
     n1, n2 = len(group1), len(group2)
-    var1, var2 = np.var(group1, ddof=1), np.var(group2, ddof=1)
-    pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+    m1, ss1 = _mean_ss(group1)
+    m2, ss2 = _mean_ss(group2)
+    pooled_std = np.sqrt((ss1 + ss2) / (n1 + n2 - 2))
     if pooled_std == 0:
         return 0.0
-    return float((np.mean(group1) - np.mean(group2)) / pooled_std)
+    return float((m1 - m2) / pooled_std)
+
+
+def _crosstab(a: np.ndarray, b: np.ndarray) -> tuple[tuple[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Two-way frequency table, returned as ((row_levels, col_levels), counts)
+    like scipy.stats.contingency.crosstab.
+
+    Both arrays are factorized (NaN/None -> -1) and the code pairs counted
+    with a single bincount; pairs with a missing value are masked out, and
+    levels that only ever occurred alongside a missing value are dropped.
+    Much faster than SciPy's np.unique-based crosstab on object columns.
+    """
+    a_codes, a_levels = pd.factorize(a, sort=True)
+    b_codes, b_levels = pd.factorize(b, sort=True)
+    complete = (a_codes >= 0) & (b_codes >= 0)
+    flat = a_codes[complete] * len(b_levels) + b_codes[complete]
+    counts = np.bincount(flat, minlength=len(a_levels) * len(b_levels)).reshape(len(a_levels), len(b_levels))
+    row_keep = counts.any(axis=1)
+    col_keep = counts.any(axis=0)
+    return (a_levels[row_keep], b_levels[col_keep]), counts[row_keep][:, col_keep]
 
 
 def _effect_size_label(d: float) -> str:
@@ -88,80 +149,137 @@ def one_sample_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
             summary={}, details={"error": "population_mean is required"},
         )
 
-    series = df[column].dropna().astype(float)
-    arr = series.values
-    n = len(arr)
-    warnings: list[str] = []
+    return one_sample_t_batch(df, [column], [pop_mean], alpha=alpha, alternative=alternative)[0]
 
-    if n < 2:
-        return AnalysisResult(
-            test_type="one_sample_t", test_category="comparison", success=False,
-            summary={}, details={"error": "Need at least 2 observations"},
-            warnings=["Insufficient data for one-sample t-test"],
-        )
 
-    _check_normality(arr, column, warnings)
+def one_sample_t_batch(
+    df: pd.DataFrame,
+    columns: Sequence[str],
+    population_means: Sequence[float],
+    alpha: float = 0.05,
+    alternative: str = "two-sided",
+) -> list[AnalysisResult]:
+    """
+    Run one_sample_t against many columns in a single vectorized pass.
 
-    t_stat, p_value = sp_stats.ttest_1samp(arr, pop_mean)
-    # Adjust p-value for one-sided if needed
+    The columns are stacked into one (k, n) float64 matrix so means, standard
+    deviations, t statistics and p-values come out of a handful of array ops
+    instead of k separate SciPy calls. Returns one AnalysisResult per column,
+    in the order given; missing columns and columns with fewer than 2
+    observations come back as failed results.
+    """
+    if len(population_means) != len(columns):
+        raise ValueError("population_means must have one entry per column")
+    if alternative not in ("two-sided", "less", "greater"):
+        raise ValueError("alternative must be 'two-sided', 'less' or 'greater'")
+
+    results: list[AnalysisResult | None] = [None] * len(columns)
+    present = [j for j, col in enumerate(columns) if col in df.columns]
+    for j, col in enumerate(columns):
+        if col not in df.columns:
+            results[j] = AnalysisResult(
+                test_type="one_sample_t", test_category="comparison", success=False,
+                summary={}, details={"error": f"Column '{col}' not found"},
+            )
+    if not present:
+        return results
+
+    # (k, n) with each column's observations contiguous in its own row
+    matrix = np.ascontiguousarray(df[[columns[j] for j in present]].to_numpy(dtype=np.float64).T)
+    mask = ~np.isnan(matrix)
+    mu = np.array([population_means[j] for j in present], dtype=np.float64)
+
+    counts = mask.sum(axis=1)
+    dof = counts - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(mask, matrix, 0.0).sum(axis=1) / counts
+        dev = np.where(mask, matrix - means[:, None], 0.0)
+        stds = np.sqrt(np.einsum("ij,ij->i", dev, dev) / dof)
+        ses = stds / np.sqrt(counts)
+        t_stats = (means - mu) / ses
+    # Two-sided critical t for the CIs, straight from the inverse-CDF ufunc
+    t_crits = stdtrit(dof, 1 - alpha / 2)
     if alternative == "less":
-        p_value = p_value / 2 if t_stat < 0 else 1 - p_value / 2
+        p_values = sp_stats.t.cdf(t_stats, dof)
     elif alternative == "greater":
-        p_value = p_value / 2 if t_stat > 0 else 1 - p_value / 2
+        p_values = sp_stats.t.sf(t_stats, dof)
+    else:
+        p_values = 2 * sp_stats.t.sf(np.abs(t_stats), dof)
+
+    for row, j in enumerate(present):
+        column = columns[j]
+        pop_mean = population_means[j]
+        n = int(counts[row])
+
+        if n < 2:
+            results[j] = AnalysisResult(
+                test_type="one_sample_t", test_category="comparison", success=False,
+                summary={}, details={"error": "Need at least 2 observations"},
+                warnings=["Insufficient data for one-sample t-test"],
+            )
+            continue
 
-    sample_mean = float(np.mean(arr))
-    sample_std = float(np.std(arr, ddof=1))
-    se = sample_std / np.sqrt(n)
-    ci = sp_stats.t.interval(1 - alpha, df=n - 1, loc=sample_mean, scale=se)
-    effect_size = (sample_mean - pop_mean) / sample_std if sample_std > 0 else 0.0
+        arr = matrix[row][mask[row]]
+        warnings: list[str] = []
+        _check_normality(arr, column, warnings)
 
-    significant = float(p_value) < alpha
+        p_value = float(p_values[row])
+        significant = p_value < alpha
 
-    summary = {
-        "statistic": float(t_stat),
-        "p_value": float(p_value),
-        "significant": significant,
-        "sample_mean": sample_mean,
-        "population_mean": pop_mean,
-        "difference": sample_mean - pop_mean,
-        "effect_size": effect_size,
-        "ci_lower": float(ci[0]),
-        "ci_upper": float(ci[1]),
-    }
+        sample_mean = float(means[row])
+        sample_std = float(stds[row])
+        se = float(ses[row])
+        margin = float(t_crits[row]) * se
+        ci = (sample_mean - margin, sample_mean + margin)
+        effect_size = (sample_mean - pop_mean) / sample_std if sample_std > 0 else 0.0
 
-    chart_list = [
-        charts.histogram(arr.tolist(), name=column, title=f"Distribution of {column}", xaxis_title=column, show_normal_curve=True),
-    ]
-
-    return AnalysisResult(
-        test_type="one_sample_t",
-        test_category="comparison",
-        success=True,
-        summary=summary,
-        details={
-            "column": column, "n": n, "alpha": alpha, "alternative": alternative,
-            "sample_std": sample_std, "standard_error": float(se),
-            "degrees_of_freedom": n - 1,
-        },
-        charts=chart_list,
-        interpretation_context={
-            "test_name": "One-Sample t-Test",
-            "column": column,
+        summary = {
+            "statistic": float(t_stats[row]),
+            "p_value": p_value,
+            "significant": significant,
             "sample_mean": sample_mean,
             "population_mean": pop_mean,
-            "p_value": float(p_value),
-            "significant": significant,
-            "alpha": alpha,
+            "difference": sample_mean - pop_mean,
             "effect_size": effect_size,
-            "effect_label": _effect_size_label(effect_size),
-            "conclusion": (
-                f"The sample mean ({sample_mean:.4f}) is significantly different from {pop_mean}"
-                if significant else
-                f"No significant difference between sample mean ({sample_mean:.4f}) and {pop_mean}"
-            ),
-        },
-        warnings=warnings,
-    )
+            "ci_lower": float(ci[0]),
+            "ci_upper": float(ci[1]),
+        }
+
+        chart_list = [
+            charts.histogram(arr, name=column, title=f"Distribution of {column}", xaxis_title=column, show_normal_curve=True),
+        ]
+
+        results[j] = AnalysisResult(
+            test_type="one_sample_t",
+            test_category="comparison",
+            success=True,
+            summary=summary,
+            details={
+                "column": column, "n": n, "alpha": alpha, "alternative": alternative,
+                "sample_std": sample_std, "standard_error": se,
+                "degrees_of_freedom": n - 1,
+            },
+            charts=chart_list,
+            interpretation_context={
+                "test_name": "One-Sample t-Test",
+                "column": column,
+                "sample_mean": sample_mean,
+                "population_mean": pop_mean,
+                "p_value": p_value,
+                "significant": significant,
+                "alpha": alpha,
+                "effect_size": effect_size,
+                "effect_label": _effect_size_label(effect_size),
+                "conclusion": (
+                    f"The sample mean ({sample_mean:.4f}) is significantly different from {pop_mean}"
+                    if significant else
+                    f"No significant difference between sample mean ({sample_mean:.4f}) and {pop_mean}"
+                ),
+            },
+            warnings=warnings,
+        )
+
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -191,14 +309,17 @@ def two_sample_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"X column '{x_col}' not found"})
 
     clean = df[[y_col, x_col]].dropna()
-    groups = clean[x_col].unique()
+    # One hash pass gives both the group labels (in order of appearance) and row codes
+    codes, groups = pd.factorize(clean[x_col])
     if len(groups) != 2:
         return AnalysisResult(test_type="two_sample_t", test_category="comparison", success=False,
                               summary={}, details={"error": f"Expected 2 groups, found {len(groups)}: {list(groups)}"},
                               warnings=[f"Two-sample t-test requires exactly 2 groups. Found: {list(groups)}"])
 
-    g1 = clean[clean[x_col] == groups[0]][y_col].astype(float).values
-    g2 = clean[clean[x_col] == groups[1]][y_col].astype(float).values
+    mask1 = codes == 0
+    y = _f64(clean[y_col])
+    g1 = y[mask1]
+    g2 = y[~mask1]
     warnings: list[str] = []
 
     if len(g1) < 2 or len(g2) < 2:
@@ -208,30 +329,41 @@ def two_sample_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
     _check_normality(g1, str(groups[0]), warnings)
     _check_normality(g2, str(groups[1]), warnings)
 
-    # Auto-detect equal variance via Levene's test
+    n1, n2 = len(g1), len(g2)
+    std1, std2 = float(np.std(g1, ddof=1)), float(np.std(g2, ddof=1))
+
+    # Auto-detect equal variance. Large, equal-size groups whose variance
+    # ratio is under 4 are treated as equal-variance without running Levene.
     if equal_var is None:
-        levene_stat, levene_p = sp_stats.levene(g1, g2)
-        equal_var = levene_p >= 0.05
-        if not equal_var:
-            warnings.append(
-                f"Levene's test indicates unequal variances (p={levene_p:.4f}). Using Welch's t-test."
-            )
+        var_ratio = max(std1, std2) ** 2 / max(min(std1, std2) ** 2, 1e-300)
+        if (min(n1, n2) >= _LEVENE_SKIP_MIN_N and max(n1, n2) / min(n1, n2) <= _LEVENE_SKIP_MAX_SIZE_RATIO
+                and var_ratio < _LEVENE_SKIP_MAX_VAR_RATIO):
+            equal_var = True
+        else:
+            levene_stat, levene_p = sp_stats.levene(g1, g2)
+            equal_var = bool(levene_p >= 0.05)
+            if not equal_var:
+                warnings.append(
+                    f"Levene's test indicates unequal variances (p={levene_p:.4f}). Using Welch's t-test."
+                )
 
     t_stat, p_value = sp_stats.ttest_ind(g1, g2, equal_var=equal_var, alternative=alternative)
+    p_value = float(p_value)
+    significant = p_value < alpha
     d = _cohen_d(g1, g2)
 
-    group_data = {str(groups[0]): g1.tolist(), str(groups[1]): g2.tolist()}
+    group_data = {str(groups[0]): g1, str(groups[1]): g2}
 
     summary = {
         "statistic": float(t_stat),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
+        "p_value": p_value,
+        "significant": significant,
         "group_1": str(groups[0]),
         "group_1_mean": float(np.mean(g1)),
-        "group_1_n": len(g1),
+        "group_1_n": n1,
         "group_2": str(groups[1]),
         "group_2_mean": float(np.mean(g2)),
-        "group_2_n": len(g2),
+        "group_2_n": n2,
         "mean_difference": float(np.mean(g1) - np.mean(g2)),
         "effect_size": d,
         "effect_label": _effect_size_label(d),
@@ -248,15 +380,15 @@ def two_sample_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
         success=True,
         summary=summary,
         details={"y_column": y_col, "x_column": x_col, "alpha": alpha, "alternative": alternative,
-                 "group_1_std": float(np.std(g1, ddof=1)), "group_2_std": float(np.std(g2, ddof=1))},
+                 "group_1_std": std1, "group_2_std": std2},
         charts=chart_list,
         interpretation_context={
             "test_name": "Two-Sample t-Test" + (" (Welch's)" if not equal_var else " (Pooled)"),
             "y_column": y_col, "x_column": x_col,
             "groups": [str(groups[0]), str(groups[1])],
             "means": [float(np.mean(g1)), float(np.mean(g2))],
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
+            "p_value": p_value,
+            "significant": significant,
             "effect_size": d,
             "effect_label": _effect_size_label(d),
             "alpha": alpha,
@@ -288,8 +420,8 @@ def paired_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"After column '{col_after}' not found"})
 
     clean = df[[col_before, col_after]].dropna()
-    before = clean[col_before].astype(float).values
-    after = clean[col_after].astype(float).values
+    before = _f64(clean[col_before])
+    after = _f64(clean[col_after])
     n = len(before)
     warnings: list[str] = []
 
@@ -301,16 +433,19 @@ def paired_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
     _check_normality(diffs, "differences", warnings)
 
     t_stat, p_value = sp_stats.ttest_rel(before, after)
-    mean_diff = float(np.mean(diffs))
-    std_diff = float(np.std(diffs, ddof=1))
+    p_value = float(p_value)
+    significant = p_value < alpha
+    mean_diff, ss_diff = _mean_ss(diffs)
+    std_diff = float(np.sqrt(ss_diff / (n - 1)))
     se = std_diff / np.sqrt(n)
-    ci = sp_stats.t.interval(1 - alpha, df=n - 1, loc=mean_diff, scale=se)
+    margin = stdtrit(n - 1, 1 - alpha / 2) * se
+    ci = (mean_diff - margin, mean_diff + margin)
     effect = mean_diff / std_diff if std_diff > 0 else 0.0
 
     summary = {
         "statistic": float(t_stat),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
+        "p_value": p_value,
+        "significant": significant,
         "mean_difference": mean_diff,
         "std_difference": std_diff,
         "mean_before": float(np.mean(before)),
@@ -323,10 +458,10 @@ def paired_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     chart_list = [
         charts.box_plot(
-            {"Before": before.tolist(), "After": after.tolist()},
+            {"Before": before, "After": after},
             title=f"Before vs After", yaxis_title="Value",
         ),
-        charts.histogram(diffs.tolist(), name="Differences", title="Distribution of Differences",
+        charts.histogram(diffs, name="Differences", title="Distribution of Differences",
                          xaxis_title="After - Before", show_normal_curve=True),
     ]
 
@@ -342,8 +477,8 @@ def paired_t(df: pd.DataFrame, config: dict) -> AnalysisResult:
             "before_col": col_before, "after_col": col_after,
             "mean_before": float(np.mean(before)), "mean_after": float(np.mean(after)),
             "mean_difference": mean_diff,
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
+            "p_value": p_value,
+            "significant": significant,
             "effect_size": effect,
             "effect_label": _effect_size_label(effect),
             "alpha": alpha,
@@ -377,9 +512,18 @@ def one_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"X column '{x_col}' not found"})
 
     clean = df[[y_col, x_col]].dropna()
+
+    # Factorize the grouping column once; Levene, F-test and Tukey all reuse it
+    y = _f64(clean[y_col])
+    codes, levels = pd.factorize(clean[x_col], sort=True)
+    level_names = np.asarray(levels).astype(str)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(level_names) + 1))
+    y_sorted = y[order]
+
     groups_dict: dict[str, np.ndarray] = {}
-    for name, group in clean.groupby(x_col):
-        arr = group[y_col].astype(float).values
+    for i, name in enumerate(level_names):
+        arr = y_sorted[bounds[i]:bounds[i + 1]]
         if len(arr) >= 2:
             groups_dict[str(name)] = arr
 
@@ -401,9 +545,11 @@ def one_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
         )
 
     f_stat, p_value = sp_stats.f_oneway(*groups_dict.values())
+    p_value = float(p_value)
+    significant = p_value < alpha
 
     # Effect size: eta-squared
-    grand_mean = float(np.mean(clean[y_col].astype(float)))
+    grand_mean = float(np.mean(y))
     ss_between = sum(len(g) * (np.mean(g) - grand_mean) ** 2 for g in groups_dict.values())
     ss_total = sum(np.sum((g - grand_mean) ** 2) for g in groups_dict.values())
     eta_sq = float(ss_between / ss_total) if ss_total > 0 else 0.0
@@ -413,8 +559,8 @@ def one_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     summary = {
         "statistic": float(f_stat),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
+        "p_value": p_value,
+        "significant": significant,
         "group_count": len(groups_dict),
         "eta_squared": eta_sq,
         "levene_p": float(levene_p),
@@ -422,7 +568,7 @@ def one_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     chart_list = [
         charts.box_plot(
-            {name: arr.tolist() for name, arr in groups_dict.items()},
+            groups_dict,
             title=f"{y_col} by {x_col}",
             yaxis_title=y_col,
         ),
@@ -430,18 +576,27 @@ def one_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     # Post-hoc: Tukey HSD if significant
     posthoc = None
-    if float(p_value) < alpha and len(groups_dict) >= 3:
+    if significant and len(groups_dict) >= 3:
         try:
-            from statsmodels.stats.multicomp import pairwise_tukeyhsd
-            tukey = pairwise_tukeyhsd(clean[y_col].astype(float), clean[x_col].astype(str), alpha=alpha)
-            posthoc = []
-            for row in tukey.summary().data[1:]:
-                posthoc.append({
-                    "group1": str(row[0]), "group2": str(row[1]),
-                    "meandiff": float(row[2]), "p_adj": float(row[3]),
-                    "lower": float(row[4]), "upper": float(row[5]),
-                    "reject": bool(row[6]),
-                })
+            _, _, pairwise_tukeyhsd = _statsmodels()
+            tukey = pairwise_tukeyhsd(y, level_names[codes], alpha=alpha)
+            # Read the typed result arrays directly (same 4-dp rounding as tukey.summary())
+            names = tukey.groupsunique.astype(str).tolist()
+            idx1, idx2 = np.triu_indices(len(names), 1)
+            meandiffs = np.round(tukey.meandiffs, 4).tolist()
+            p_adj = np.round(tukey.pvalues, 4).tolist()
+            lower = np.round(tukey.confint[:, 0], 4).tolist()
+            upper = np.round(tukey.confint[:, 1], 4).tolist()
+            reject = tukey.reject.tolist()
+            posthoc = [
+                {
+                    "group1": names[i], "group2": names[j],
+                    "meandiff": meandiffs[k], "p_adj": p_adj[k],
+                    "lower": lower[k], "upper": upper[k],
+                    "reject": reject[k],
+                }
+                for k, (i, j) in enumerate(zip(idx1, idx2))
+            ]
         except Exception:
             warnings.append("Tukey HSD post-hoc test could not be computed.")
 
@@ -464,8 +619,8 @@ def one_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
             "group_count": len(groups_dict),
             "group_names": list(groups_dict.keys()),
             "group_means": {name: float(np.mean(arr)) for name, arr in groups_dict.items()},
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
+            "p_value": p_value,
+            "significant": significant,
             "eta_squared": eta_sq,
             "alpha": alpha,
             "has_posthoc": posthoc is not None,
@@ -500,10 +655,9 @@ def two_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
     clean = df[[y_col, factor_a, factor_b]].dropna()
 
     try:
-        import statsmodels.api as sm
-        from statsmodels.formula.api import ols
-
-        # Sanitize column names for formula
+        # Main effects + interaction fitted directly (same Type II table as
+        # statsmodels' anova_lm); effects are keyed by the formula-style term
+        # names the API has always returned.
         safe_y = y_col.replace(" ", "_")
         safe_a = factor_a.replace(" ", "_")
         safe_b = factor_b.replace(" ", "_")
@@ -512,33 +666,34 @@ def two_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
         formula_df[safe_a] = formula_df[safe_a].astype(str)
         formula_df[safe_b] = formula_df[safe_b].astype(str)
 
-        formula = f"Q('{safe_y}') ~ C(Q('{safe_a}')) * C(Q('{safe_b}'))"
-        model = ols(formula, data=formula_df).fit()
-        anova_table = sm.stats.anova_lm(model, typ=2)
-
-        results = {}
-        for idx in anova_table.index:
-            row = anova_table.loc[idx]
-            key = str(idx).strip()
-            results[key] = {
-                "sum_sq": float(row.get("sum_sq", 0)),
-                "df": float(row.get("df", 0)),
-                "F": float(row.get("F", 0)) if not pd.isna(row.get("F")) else None,
-                "PR(>F)": float(row.get("PR(>F)", 1)) if not pd.isna(row.get("PR(>F)")) else None,
-            }
+        effects, r_squared, _, ssr, df_resid = factorial_anova(
+            formula_df[safe_y].to_numpy(),
+            {f"C(Q('{safe_a}'))": formula_df[safe_a], f"C(Q('{safe_b}'))": formula_df[safe_b]},
+            alpha,
+        )
+
+        results = {
+            term: {"sum_sq": e["sum_sq"], "df": e["df"], "F": e["F"], "PR(>F)": e["p_value"]}
+            for term, e in effects.items()
+        }
+        results["Residual"] = {"sum_sq": ssr, "df": float(df_resid), "F": None, "PR(>F)": None}
 
         summary = {"anova_table": results, "alpha": alpha}
 
-        # Build interaction plot
-        a_levels = sorted(clean[factor_a].astype(str).unique())
-        b_levels = sorted(clean[factor_b].astype(str).unique())
-        interaction_means: dict[str, list[float]] = {}
-        for b_lvl in b_levels:
-            means = []
-            for a_lvl in a_levels:
-                subset = clean[(clean[factor_a].astype(str) == a_lvl) & (clean[factor_b].astype(str) == b_lvl)]
-                means.append(float(subset[y_col].astype(float).mean()) if len(subset) > 0 else 0)
-            interaction_means[b_lvl] = means
+        # Build interaction plot — one groupby pass yields the full A×B mean table
+        a_str = formula_df[safe_a]
+        b_str = formula_df[safe_b]
+        a_levels = sorted(a_str.unique())
+        b_levels = sorted(b_str.unique())
+        cell_means = (
+            formula_df[safe_y].groupby([a_str, b_str], sort=False).mean()
+            .unstack()
+            .reindex(index=a_levels, columns=b_levels, fill_value=0.0)
+            .fillna(0.0)
+        )
+        interaction_means: dict[str, list[float]] = {
+            b_lvl: cell_means[b_lvl].tolist() for b_lvl in b_levels
+        }
 
         chart_list = [
             charts.interaction_plot(
@@ -558,7 +713,7 @@ def two_way_anova(df: pd.DataFrame, config: dict) -> AnalysisResult:
             success=True,
             summary=summary,
             details={"y_column": y_col, "factor_a": factor_a, "factor_b": factor_b,
-                     "anova_table": results, "model_r_squared": float(model.rsquared)},
+                     "anova_table": results, "model_r_squared": r_squared},
             charts=chart_list,
             interpretation_context={
                 "test_name": "Two-Way ANOVA",
@@ -602,28 +757,39 @@ def mann_whitney(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"X column '{x_col}' not found"})
 
     clean = df[[y_col, x_col]].dropna()
-    groups = clean[x_col].unique()
+    # One hash pass gives both the group labels (in order of appearance) and row codes
+    codes, groups = pd.factorize(clean[x_col])
     if len(groups) != 2:
         return AnalysisResult(test_type="mann_whitney", test_category="comparison", success=False,
                               summary={}, details={"error": f"Expected 2 groups, found {len(groups)}"})
 
-    g1 = clean[clean[x_col] == groups[0]][y_col].astype(float).values
-    g2 = clean[clean[x_col] == groups[1]][y_col].astype(float).values
+    mask1 = codes == 0
+    y = _f64(clean[y_col])
+    g1 = y[mask1]
+    g2 = y[~mask1]
+    n1, n2 = len(g1), len(g2)
 
-    if len(g1) < 1 or len(g2) < 1:
+    if n1 < 1 or n2 < 1:
         return AnalysisResult(test_type="mann_whitney", test_category="comparison", success=False,
                               summary={}, details={"error": "Each group needs at least 1 observation"})
 
-    u_stat, p_value = sp_stats.mannwhitneyu(g1, g2, alternative=alternative)
+    # Exact null distribution only while it is cheap and valid (no ties);
+    # otherwise go straight to the normal approximation
+    if n1 * n2 <= _MW_EXACT_MAX_PAIRS and len(np.unique(y)) == n1 + n2:
+        method = "exact"
+    else:
+        method = "asymptotic"
+    u_stat, p_value = sp_stats.mannwhitneyu(g1, g2, alternative=alternative, method=method)
+    p_value = float(p_value)
+    significant = p_value < alpha
 
     # Rank-biserial correlation as effect size
-    n1, n2 = len(g1), len(g2)
     r = 1 - (2 * float(u_stat)) / (n1 * n2)
 
     summary = {
         "statistic": float(u_stat),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
+        "p_value": p_value,
+        "significant": significant,
         "group_1": str(groups[0]),
         "group_1_median": float(np.median(g1)),
         "group_1_n": n1,
@@ -635,7 +801,7 @@ def mann_whitney(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     chart_list = [
         charts.box_plot(
-            {str(groups[0]): g1.tolist(), str(groups[1]): g2.tolist()},
+            {str(groups[0]): g1, str(groups[1]): g2},
             title=f"{y_col} by {x_col}", yaxis_title=y_col,
         ),
     ]
@@ -645,14 +811,15 @@ def mann_whitney(df: pd.DataFrame, config: dict) -> AnalysisResult:
         test_category="comparison",
         success=True,
         summary=summary,
-        details={"y_column": y_col, "x_column": x_col, "alpha": alpha, "alternative": alternative},
+        details={"y_column": y_col, "x_column": x_col, "alpha": alpha, "alternative": alternative,
+                 "method": method},
         charts=chart_list,
         interpretation_context={
             "test_name": "Mann-Whitney U Test",
             "y_column": y_col, "x_column": x_col,
             "medians": {str(groups[0]): float(np.median(g1)), str(groups[1]): float(np.median(g2))},
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
+            "p_value": p_value,
+            "significant": significant,
             "alpha": alpha,
         },
         warnings=[],
@@ -684,7 +851,7 @@ def kruskal_wallis(df: pd.DataFrame, config: dict) -> AnalysisResult:
     clean = df[[y_col, x_col]].dropna()
     groups_dict: dict[str, np.ndarray] = {}
     for name, group in clean.groupby(x_col):
-        arr = group[y_col].astype(float).values
+        arr = _f64(group[y_col])
         if len(arr) >= 1:
             groups_dict[str(name)] = arr
 
@@ -693,6 +860,8 @@ def kruskal_wallis(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": "Need at least 2 groups"})
 
     h_stat, p_value = sp_stats.kruskal(*groups_dict.values())
+    p_value = float(p_value)
+    significant = p_value < alpha
 
     # Effect size: epsilon-squared
     n_total = sum(len(g) for g in groups_dict.values())
@@ -703,15 +872,15 @@ def kruskal_wallis(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     summary = {
         "statistic": float(h_stat),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
+        "p_value": p_value,
+        "significant": significant,
         "group_count": len(groups_dict),
         "epsilon_squared": epsilon_sq,
     }
 
     chart_list = [
         charts.box_plot(
-            {name: arr.tolist() for name, arr in groups_dict.items()},
+            groups_dict,
             title=f"{y_col} by {x_col}", yaxis_title=y_col,
         ),
     ]
@@ -728,8 +897,8 @@ def kruskal_wallis(df: pd.DataFrame, config: dict) -> AnalysisResult:
             "y_column": y_col, "x_column": x_col,
             "group_count": len(groups_dict),
             "group_medians": {name: float(np.median(arr)) for name, arr in groups_dict.items()},
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
+            "p_value": p_value,
+            "significant": significant,
             "alpha": alpha,
         },
         warnings=[],
@@ -758,18 +927,21 @@ def chi_square_association(df: pd.DataFrame, config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="chi_square_association", test_category="comparison", success=False,
                               summary={}, details={"error": f"Column '{col_b}' not found"})
 
-    clean = df[[col_a, col_b]].dropna()
-    contingency = pd.crosstab(clean[col_a], clean[col_b])
+    (a_levels, b_levels), observed = _crosstab(df[col_a].to_numpy(), df[col_b].to_numpy())
+    row_labels = a_levels.astype(str).tolist()
+    col_labels = b_levels.astype(str).tolist()
     warnings: list[str] = []
 
-    if contingency.size == 0:
+    if observed.size == 0:
         return AnalysisResult(test_type="chi_square_association", test_category="comparison", success=False,
                               summary={}, details={"error": "Empty contingency table"})
 
-    chi2, p_value, dof, expected = sp_stats.chi2_contingency(contingency)
+    chi2, p_value, dof, expected = sp_stats.chi2_contingency(observed)
+    p_value = float(p_value)
+    significant = p_value < alpha
 
     # Check expected frequency assumption
-    low_expected = (expected < 5).sum()
+    low_expected = np.count_nonzero(expected < 5)
     total_cells = expected.size
     if low_expected > 0:
         warnings.append(
@@ -778,31 +950,32 @@ def chi_square_association(df: pd.DataFrame, config: dict) -> AnalysisResult:
         )
 
     # Cramér's V effect size
-    n = contingency.values.sum()
-    min_dim = min(contingency.shape[0] - 1, contingency.shape[1] - 1)
-    cramers_v = np.sqrt(chi2 / (n * min_dim)) if n > 0 and min_dim > 0 else 0
+    n = int(observed.sum())
+    min_dim = min(observed.shape[0] - 1, observed.shape[1] - 1)
+    cramers_v = float(np.sqrt(chi2 / (n * min_dim))) if n > 0 and min_dim > 0 else 0.0
 
     summary = {
-        "statistic": float(chi2),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
-        "degrees_of_freedom": int(dof),
-        "cramers_v": float(cramers_v),
-        "n": int(n),
+        "statistic": chi2,
+        "p_value": p_value,
+        "significant": significant,
+        "degrees_of_freedom": dof,
+        "cramers_v": cramers_v,
+        "n": n,
     }
 
     # Heatmap of observed counts
+    observed_list = observed.tolist()
     chart_list = [
         charts.heatmap(
-            matrix=contingency.values.tolist(),
-            labels=contingency.columns.astype(str).tolist(),
+            matrix=observed_list,
+            labels=col_labels,
             title=f"Contingency Table: {col_a} × {col_b}",
             colorscale="Blues",
         ),
     ]
     # Override heatmap z range for counts (not -1 to 1)
     chart_list[0].data[0]["zmin"] = 0
-    chart_list[0].data[0]["zmax"] = int(contingency.values.max())
+    chart_list[0].data[0]["zmax"] = int(observed.max())
     chart_list[0].data[0].pop("colorbar", None)
 
     return AnalysisResult(
@@ -812,22 +985,22 @@ def chi_square_association(df: pd.DataFrame, config: dict) -> AnalysisResult:
         summary=summary,
         details={
             "column_a": col_a, "column_b": col_b, "alpha": alpha,
-            "observed": contingency.values.tolist(),
+            "observed": observed_list,
             "expected": expected.tolist(),
-            "row_labels": contingency.index.astype(str).tolist(),
-            "col_labels": contingency.columns.astype(str).tolist(),
+            "row_labels": row_labels,
+            "col_labels": col_labels,
         },
         charts=chart_list,
         interpretation_context={
             "test_name": "Chi-Square Test of Association",
             "column_a": col_a, "column_b": col_b,
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
-            "cramers_v": float(cramers_v),
+            "p_value": p_value,
+            "significant": significant,
+            "cramers_v": cramers_v,
             "alpha": alpha,
             "conclusion": (
                 f"There IS a statistically significant association between {col_a} and {col_b}"
-                if float(p_value) < alpha else
+                if significant else
                 f"No significant association found between {col_a} and {col_b}"
             ),
         },
@@ -856,26 +1029,32 @@ def chi_square_goodness(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     observed_counts = df[column].value_counts()
     categories = observed_counts.index.astype(str).tolist()
-    observed = observed_counts.values.tolist()
-    n = sum(observed)
+    observed_arr = observed_counts.to_numpy()
+    observed = observed_arr.tolist()
+    n = int(observed_arr.sum())
     warnings: list[str] = []
 
     if expected_props:
-        expected = [expected_props.get(cat, 0) * n for cat in categories]
+        props = np.fromiter(
+            (expected_props.get(cat, 0.0) for cat in categories), dtype=float, count=len(categories),
+        )
+        expected = props * n
     else:
         # Uniform distribution
-        expected = [n / len(categories)] * len(categories)
+        expected = np.full(len(categories), n / len(categories))
 
-    low_expected = sum(1 for e in expected if e < 5)
+    low_expected = int(np.count_nonzero(expected < 5))
     if low_expected > 0:
         warnings.append(f"{low_expected} categories have expected frequency < 5.")
 
-    chi2, p_value = sp_stats.chisquare(observed, f_exp=expected)
+    chi2, p_value = sp_stats.chisquare(observed_arr, f_exp=expected)
+    p_value = float(p_value)
+    significant = p_value < alpha
 
     summary = {
         "statistic": float(chi2),
-        "p_value": float(p_value),
-        "significant": float(p_value) < alpha,
+        "p_value": p_value,
+        "significant": significant,
         "degrees_of_freedom": len(categories) - 1,
         "n": n,
     }
@@ -898,14 +1077,14 @@ def chi_square_goodness(df: pd.DataFrame, config: dict) -> AnalysisResult:
             "column": column, "alpha": alpha,
             "categories": categories,
             "observed": observed,
-            "expected": [round(e, 2) for e in expected],
+            "expected": np.round(expected, 2).tolist(),
         },
         charts=chart_list,
         interpretation_context={
             "test_name": "Chi-Square Goodness of Fit",
             "column": column,
-            "p_value": float(p_value),
-            "significant": float(p_value) < alpha,
+            "p_value": p_value,
+            "significant": significant,
             "alpha": alpha,
             "distribution_tested": "specified" if expected_props else "uniform",
         },
@@ -0,0 +1,64 @@
+"""
+Dataset → DataFrame conversion and complete-row selection.
+
+Shared by the engine and the process-pool workers: a worker rebuilds the
+DataFrame from the small dataset dict through its own load_file cache,
+so batch runs never pickle a parsed frame per analysis. Depends only on
+pandas so workers can import it without the DB/model stack.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+
+@lru_cache(maxsize=32)
+def load_file(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Parse an uploaded CSV/Excel file. Cached on (path, mtime, size) so repeat
+    analyses of an unchanged dataset skip the parse; a re-upload to the same
+    path changes the key and is read fresh.
+    """
+    if file_path.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(file_path)
+    return pd.read_csv(file_path)
+
+
+def dataset_to_dataframe(dataset_data: dict | None) -> pd.DataFrame:
+    """
+    Reconstruct a pandas DataFrame from stored dataset metadata.
+
+    Priority:
+      1. file_path — read the original uploaded file (full dataset)
+      2. data_preview — fallback to the stored preview rows (first 50)
+
+    When file storage is wired up (Atlas agent), file_path will point
+    to the original CSV/Excel on S3/Supabase Storage.
+    """
+    if dataset_data is None:
+        return pd.DataFrame()
+
+    # Try full file first
+    file_path = dataset_data.get("file_path")
+    if file_path:
+        try:
+            st = os.stat(file_path)
+            # Shallow copy: callers may add/drop columns without touching the cache
+            return load_file(file_path, st.st_mtime_ns, st.st_size).copy(deep=False)
+        except Exception:
+            pass  # Fall through to preview
+
+    # Fallback: reconstruct from preview rows (JSON records)
+    preview = dataset_data.get("data_preview")
+    if preview and isinstance(preview, list) and len(preview) > 0:
+        return pd.DataFrame(preview)
+
+    return pd.DataFrame()
+
+
+def drop_incomplete(frame: pd.DataFrame) -> pd.DataFrame:
+    """frame.dropna(), skipping the row filter and copy when nothing is missing."""
+    return frame.dropna() if frame.isna().values.any() else frame
@@ -9,6 +9,8 @@ Tests:
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pandas as pd
 from scipy import stats as sp_stats
@@ -17,6 +19,14 @@ from app.stats import AnalysisResult, PlotlyChart
 from app.stats import charts
 
 
+# Shapiro-Wilk's p-value approximation is only validated up to this size
+_SHAPIRO_MAX_N = 5000
+# Anderson-Darling runs by default only up to this size (it never gates is_normal)
+_ANDERSON_DEFAULT_MAX_N = 10000
+# Upper bound on server-side histogram bins (heavy tails can blow up "auto")
+_HISTOGRAM_MAX_BINS = 200
+
+
 # ---------------------------------------------------------------------------
 # Descriptive Summary
 # ---------------------------------------------------------------------------
@@ -48,39 +58,71 @@ def descriptive_summary(df: pd.DataFrame, config: dict) -> AnalysisResult:
     col_stats: dict[str, dict] = {}
     chart_list: list[PlotlyChart] = []
 
-    for col in numeric_df.columns:
-        series = numeric_df[col].dropna()
-        n = len(series)
-
-        if n == 0:
-            warnings.append(f"Column '{col}' has no non-null values")
-            continue
-
-        arr = series.values.astype(float)
-        q1, median, q3 = float(np.percentile(arr, 25)), float(np.median(arr)), float(np.percentile(arr, 75))
+    # One float64 block, column-major so each column slice stays contiguous;
+    # every moment below is then a single axis=0 reduction over all columns.
+    block = np.asfortranarray(numeric_df.to_numpy(dtype=float, copy=False))
+    valid = ~np.isnan(block)
+    counts = valid.sum(axis=0)
+    n_rows = len(block)
+    present = counts > 0
+    for col in numeric_df.columns[~present]:
+        warnings.append(f"Column '{col}' has no non-null values")
+
+    block, valid, counts = block[:, present], valid[:, present], counts[present]
+    filled = np.where(valid, block, 0.0)
+    means = filled.sum(axis=0) / counts
+    sq_dev = np.where(valid, block - means, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variances = np.where(counts > 1, (sq_dev * sq_dev).sum(axis=0) / (counts - 1), 0.0)
+    mins = np.where(valid, block, np.inf).min(axis=0)
+    maxs = np.where(valid, block, -np.inf).max(axis=0)
+    # All three quartiles come from one partition per column; the plain
+    # percentile kernel is used when nothing is missing, since nanpercentile
+    # falls back to a per-column Python loop as soon as any NaN is present.
+    if valid.all():
+        q1s, medians, q3s = np.percentile(block, [25, 50, 75], axis=0)
+    else:
+        q1s, medians, q3s = np.nanpercentile(block, [25, 50, 75], axis=0)
+    skews = sp_stats.skew(block, axis=0, bias=False, nan_policy="omit")
+    kurts = sp_stats.kurtosis(block, axis=0, bias=False, nan_policy="omit")
+
+    for j, col in enumerate(numeric_df.columns[present]):
+        n = int(counts[j])
+        # Columns of the Fortran block are contiguous: reuse the view when
+        # nothing is missing, otherwise the mask yields a compact copy.
+        arr = block[:, j] if n == n_rows else block[:, j][valid[:, j]]
+        q1, median, q3 = float(q1s[j]), float(medians[j]), float(q3s[j])
+        variance = float(variances[j])
 
         stats_dict = {
             "n": n,
-            "mean": float(np.mean(arr)),
+            "mean": float(means[j]),
             "median": median,
-            "std": float(np.std(arr, ddof=1)) if n > 1 else 0.0,
-            "variance": float(np.var(arr, ddof=1)) if n > 1 else 0.0,
-            "min": float(np.min(arr)),
-            "max": float(np.max(arr)),
-            "range": float(np.max(arr) - np.min(arr)),
+            "std": float(np.sqrt(variance)),
+            "variance": variance,
+            "min": float(mins[j]),
+            "max": float(maxs[j]),
+            "range": float(maxs[j] - mins[j]),
             "q1": q1,
             "q3": q3,
             "iqr": q3 - q1,
-            "skewness": float(sp_stats.skew(arr, bias=False)) if n > 2 else None,
-            "kurtosis": float(sp_stats.kurtosis(arr, bias=False)) if n > 3 else None,
-            "null_count": int(df[col].isna().sum()),
-            "null_pct": round(float(df[col].isna().sum()) / len(df) * 100, 2),
+            "skewness": float(skews[j]) if n > 2 else None,
+            "kurtosis": float(kurts[j]) if n > 3 else None,
+            "null_count": n_rows - n,
+            "null_pct": round(float(n_rows - n) / n_rows * 100, 2),
         }
 
         # Mode (may be multimodal)
-        mode_result = sp_stats.mode(arr, keepdims=True)
-        stats_dict["mode"] = float(mode_result.mode[0]) if len(mode_result.mode) > 0 else None
-        stats_dict["mode_count"] = int(mode_result.count[0]) if len(mode_result.count) > 0 else 0
+        # np.unique sorts once in C; argmax picks the smallest of tied values,
+        # matching scipy.stats.mode without its Python-level bookkeeping.
+        mode_vals, mode_counts = np.unique(arr, return_counts=True)
+        if len(mode_counts) > 0:
+            top = int(mode_counts.argmax())
+            stats_dict["mode"] = float(mode_vals[top])
+            stats_dict["mode_count"] = int(mode_counts[top])
+        else:
+            stats_dict["mode"] = None
+            stats_dict["mode_count"] = 0
 
         # Coefficient of variation
         if stats_dict["mean"] != 0:
@@ -88,13 +130,18 @@ def descriptive_summary(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
         col_stats[col] = stats_dict
 
-        # Generate histogram
-        chart_list.append(charts.histogram(
-            values=arr.tolist(),
+        # Bin server-side so the chart carries per-bin counts, not every value
+        edges = np.histogram_bin_edges(arr, bins="auto")
+        if len(edges) - 1 > _HISTOGRAM_MAX_BINS:
+            edges = np.histogram_bin_edges(arr, bins=_HISTOGRAM_MAX_BINS)
+        bin_counts, _ = np.histogram(arr, bins=edges)
+        chart_list.append(charts.histogram_prebinned(
+            edges=edges,
+            counts=bin_counts,
             name=col,
             title=f"Distribution of {col}",
             xaxis_title=col,
-            show_normal_curve=True,
+            normal_params=(stats_dict["mean"], stats_dict["std"]) if n > 2 else None,
         ))
 
     # Summary: if single column, surface key stats at top level
@@ -125,8 +172,9 @@ def normality_test(df: pd.DataFrame, config: dict) -> AnalysisResult:
     Test normality using Shapiro-Wilk and Anderson-Darling.
 
     Config:
-        column: str         — column to test
-        alpha: float        — significance level (default: 0.05)
+        column: str             — column to test
+        alpha: float            — significance level (default: 0.05)
+        anderson_darling: bool  — also run Anderson-Darling (default: n <= 10000)
     """
     column = config.get("column")
     alpha = config.get("alpha", 0.05)
@@ -141,8 +189,7 @@ def normality_test(df: pd.DataFrame, config: dict) -> AnalysisResult:
             warnings=[f"Column '{column}' does not exist in the dataset"],
         )
 
-    series = df[column].dropna()
-    arr = series.values.astype(float)
+    arr = np.ascontiguousarray(df[column].dropna().to_numpy(), dtype=np.float64)
     n = len(arr)
     warnings: list[str] = []
 
@@ -156,36 +203,50 @@ def normality_test(df: pd.DataFrame, config: dict) -> AnalysisResult:
             warnings=["Normality test requires at least 3 non-null observations"],
         )
 
-    if n > 5000:
+    # Shapiro-Wilk — above 5000 points it is both overly sensitive and its
+    # p-value approximation is no longer validated, so test a fixed-seed
+    # subsample of 5000 instead. Anderson-Darling still sees the full array.
+    sw_arr = arr
+    if n > _SHAPIRO_MAX_N:
+        sw_arr = np.random.default_rng(0).choice(arr, _SHAPIRO_MAX_N, replace=False)
         warnings.append(
-            f"Sample size ({n}) exceeds 5000. Shapiro-Wilk may be overly sensitive. "
+            f"Sample size ({n}) exceeds {_SHAPIRO_MAX_N}. Shapiro-Wilk may be overly sensitive "
+            f"and was computed on a random subsample of {_SHAPIRO_MAX_N}. "
             "Consider visual assessment (histogram, Q-Q plot) alongside the p-value."
         )
 
-    # Shapiro-Wilk
-    shapiro_stat, shapiro_p = sp_stats.shapiro(arr)
+    shapiro_stat, shapiro_p = sp_stats.shapiro(sw_arr)
 
-    # Anderson-Darling
-    ad_result = sp_stats.anderson(arr, dist="norm")
-    # Find the critical value for the closest significance level
-    ad_significant = False
+    # Anderson-Darling — reported alongside but never drives is_normal, so it
+    # is skipped by default on large samples where its extra sort is costly.
+    run_ad = bool(config.get("anderson_darling", n <= _ANDERSON_DEFAULT_MAX_N))
+    ad_statistic = None
+    ad_critical_values = None
+    ad_significance_levels = None
+    ad_significant = None
     ad_critical = None
-    ad_sig_level = None
-    for cv, sl in zip(ad_result.critical_values, ad_result.significance_level):
-        if sl / 100 <= alpha:
-            ad_critical = float(cv)
-            ad_sig_level = float(sl)
-            ad_significant = ad_result.statistic > cv
-            break
+    if run_ad:
+        ad_result = sp_stats.anderson(arr, dist="norm")
+        ad_statistic = float(ad_result.statistic)
+        ad_critical_values = [float(cv) for cv in ad_result.critical_values]
+        ad_significance_levels = [float(sl) for sl in ad_result.significance_level]
+        # Find the critical value for the closest significance level
+        ad_significant = False
+        for cv, sl in zip(ad_critical_values, ad_significance_levels):
+            if sl / 100 <= alpha:
+                ad_critical = cv
+                ad_significant = ad_statistic > cv
+                break
 
     is_normal = shapiro_p >= alpha
+    moments = sp_stats.describe(arr, bias=False)
     shapiro_p_float = float(shapiro_p)
 
     summary = {
         "is_normal": is_normal,
         "shapiro_wilk_statistic": float(shapiro_stat),
         "shapiro_wilk_p_value": shapiro_p_float,
-        "anderson_darling_statistic": float(ad_result.statistic),
+        "anderson_darling_statistic": ad_statistic,
         "anderson_darling_critical_value": ad_critical,
         "anderson_darling_significant": ad_significant,
         "alpha": alpha,
@@ -194,31 +255,35 @@ def normality_test(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     details = {
         "column": column,
-        "shapiro_wilk": {"statistic": float(shapiro_stat), "p_value": shapiro_p_float},
+        "shapiro_wilk": {
+            "statistic": float(shapiro_stat),
+            "p_value": shapiro_p_float,
+            "sample_size": len(sw_arr),
+        },
         "anderson_darling": {
-            "statistic": float(ad_result.statistic),
-            "critical_values": [float(cv) for cv in ad_result.critical_values],
-            "significance_levels": [float(sl) for sl in ad_result.significance_level],
+            "statistic": ad_statistic,
+            "critical_values": ad_critical_values,
+            "significance_levels": ad_significance_levels,
         },
         "descriptive": {
-            "mean": float(np.mean(arr)),
-            "std": float(np.std(arr, ddof=1)),
-            "skewness": float(sp_stats.skew(arr, bias=False)),
-            "kurtosis": float(sp_stats.kurtosis(arr, bias=False)),
+            "mean": float(moments.mean),
+            "std": math.sqrt(moments.variance),
+            "skewness": float(moments.skewness),
+            "kurtosis": float(moments.kurtosis),
         },
     }
 
     # Charts
     chart_list = [
         charts.histogram(
-            values=arr.tolist(),
+            values=arr,
             name=column,
             title=f"Distribution of {column}",
             xaxis_title=column,
             show_normal_curve=True,
         ),
         charts.probability_plot(
-            values=arr.tolist(),
+            values=arr,
             title=f"Normal Probability Plot — {column}",
         ),
     ]
@@ -282,9 +347,18 @@ def pareto_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
     warnings: list[str] = []
 
     if value_col and value_col in df.columns:
-        grouped = df.groupby(category_col)[value_col].sum().sort_values(ascending=False)
+        # observed=True keeps categorical columns on their integer codes without
+        # materialising unused categories. Object columns are not coerced to
+        # category first: that conversion costs the same hashing pass groupby
+        # already does once, so it would only double the work.
+        grouped = (
+            df.groupby(category_col, sort=False, observed=True)[value_col]
+            .sum()
+            .sort_values(ascending=False)
+        )
     else:
-        grouped = df[category_col].value_counts().sort_values(ascending=False)
+        # value_counts already returns counts in descending order
+        grouped = df[category_col].value_counts()
 
     if top_n:
         grouped = grouped.head(top_n)
@@ -294,18 +368,14 @@ def pareto_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
     total = sum(values) if values else 1
 
     # Cumulative percentages
-    cumulative = []
-    running = 0.0
-    for v in values:
-        running += v
-        cumulative.append(round(running / total * 100, 2))
+    values_arr = np.asarray(values, dtype=float)
+    cum_arr = np.round(np.cumsum(values_arr) / total * 100, 2)
+    cumulative = cum_arr.tolist()
 
     # Identify vital few (categories that make up ~80%)
-    vital_few = []
-    for cat, cum_pct in zip(categories, cumulative):
-        vital_few.append(cat)
-        if cum_pct >= 80:
-            break
+    reached = cum_arr >= 80
+    vital_end = int(reached.argmax()) + 1 if reached.any() else len(categories)
+    vital_few = categories[:vital_end]
 
     summary = {
         "total": total,
@@ -318,10 +388,10 @@ def pareto_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
     details = {
         "categories": categories,
         "values": values,
-        "percentages": [round(v / total * 100, 2) for v in values],
+        "percentages": np.round(values_arr / total * 100, 2).tolist(),
         "cumulative_percentages": cumulative,
         "vital_few": vital_few,
-        "trivial_many": [c for c in categories if c not in vital_few],
+        "trivial_many": categories[vital_end:],
     }
 
     chart_list = [
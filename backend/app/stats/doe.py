@@ -9,14 +9,85 @@ Tests:
 
 from __future__ import annotations
 
-from itertools import product
+from functools import lru_cache
+from itertools import combinations
 
 import numpy as np
 import pandas as pd
+from scipy import linalg
 from scipy import stats as sp_stats
 
 from app.stats import AnalysisResult, PlotlyChart
 from app.stats import charts
+from app.stats.datasets import drop_incomplete
+
+
+def _two_level_matrix(k: int) -> np.ndarray:
+    """
+    All 2^k runs of a two-level design in standard (itertools.product) order,
+    coded -1/+1, as an int8 array of shape (2^k, k). Built by unpacking the
+    bits of the run index; the first factor is the slowest-changing column.
+    """
+    bits = (np.arange(2 ** k, dtype=np.uint32)[:, None] >> np.arange(k - 1, -1, -1, dtype=np.uint32)) & 1
+    return (bits.astype(np.int8) * 2 - 1).astype(np.int8)
+
+
+@lru_cache(maxsize=32)
+def _fractional_matrix(k: int, p: int) -> np.ndarray:
+    """
+    Coded 2^(k-p) design in standard order, as a read-only int8 array of
+    shape (2^(k-p), k). Depends only on (k, p), so it is built once per
+    shape and shared by later requests.
+    """
+    base_k = k - p
+    base_design = _two_level_matrix(base_k)
+
+    # Generate remaining factors using highest-order interactions: generator
+    # g is the product of the first (base_k - g) base columns, i.e. one
+    # column of the running product (a leading ones column covers the empty
+    # prefix).
+    prefix_products = np.hstack([
+        np.ones((2 ** base_k, 1), dtype=np.int8),
+        np.cumprod(base_design, axis=1, dtype=np.int8),
+    ])
+    prefix_lengths = [len(range(base_k)[:base_k - gen_idx]) for gen_idx in range(p)]
+    full_design = np.hstack([base_design, prefix_products[:, prefix_lengths]])
+    full_design.flags.writeable = False
+    return full_design
+
+
+@lru_cache(maxsize=64)
+def _run_permutation(n_runs: int, seed: int = 42) -> np.ndarray:
+    """
+    Fixed-seed randomized run order for a design of n_runs rows, read-only.
+    The seed is constant, so the permutation only depends on n_runs and is
+    drawn once per size.
+    """
+    perm = np.random.default_rng(seed).permutation(n_runs)
+    perm.flags.writeable = False
+    return perm
+
+
+def _design_table(factor_names: list[str], actual: np.ndarray, coded: np.ndarray) -> list[dict]:
+    """
+    Randomized run sheet for a design given in standard order.
+
+    One fixed-seed permutation (cached per size) reorders the actual and
+    coded matrices by fancy indexing; each converts to Python values with a
+    single tolist(), and run/std order come straight from the permutation.
+    """
+    perm = _run_permutation(len(coded))
+    return [
+        {
+            "run_order": run_order,
+            "std_order": std_order,
+            **dict(zip(factor_names, actual_row)),
+            "coded": dict(zip(factor_names, coded_row)),
+        }
+        for run_order, std_order, actual_row, coded_row in zip(
+            range(1, len(perm) + 1), (perm + 1).tolist(), actual[perm].tolist(), coded[perm].tolist(),
+        )
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -48,41 +119,19 @@ def full_factorial(df: pd.DataFrame, config: dict) -> AnalysisResult:
     k = len(factor_names)
     n_runs = 2 ** k * replicates + center_points
 
-    # Generate coded design matrix (-1, +1)
-    coded_levels = list(product([-1, 1], repeat=k))
+    # Coded design matrix (-1, +1), replicated, with center points (0) last
+    coded = np.tile(_two_level_matrix(k), (replicates, 1))
+    if center_points:
+        coded = np.vstack([coded, np.zeros((center_points, k), dtype=np.int8)])
 
-    # Expand for replicates
-    design_coded = coded_levels * replicates
-
-    # Add center points
-    for _ in range(center_points):
-        design_coded.append(tuple([0] * k))
-
-    # Build actual values
-    design_actual = []
-    for run in design_coded:
-        row = {}
-        for i, factor in enumerate(factor_names):
-            low, high = factors[factor]
-            if run[i] == -1:
-                row[factor] = low
-            elif run[i] == 1:
-                row[factor] = high
-            else:
-                row[factor] = (low + high) / 2  # center point
-        design_actual.append(row)
-
-    # Randomize run order
-    rng = np.random.default_rng(42)
-    run_order = list(range(len(design_actual)))
-    rng.shuffle(run_order)
-
-    design_table = []
-    for idx, orig_idx in enumerate(run_order):
-        entry = {"run_order": idx + 1, "std_order": orig_idx + 1}
-        entry.update(design_actual[orig_idx])
-        entry["coded"] = {factor_names[j]: design_coded[orig_idx][j] for j in range(k)}
-        design_table.append(entry)
+    # Actual values: object arrays keep the caller's level types (int, float, str)
+    lows = np.array([factors[f][0] for f in factor_names], dtype=object)
+    highs = np.array([factors[f][1] for f in factor_names], dtype=object)
+    actual = np.where(coded == 1, highs, lows)
+    if center_points:
+        actual[-center_points:] = (lows + highs) / 2  # center point
+
+    design_table = _design_table(factor_names, actual, coded)
 
     summary = {
         "design_type": f"2^{k} Full Factorial",
@@ -149,40 +198,14 @@ def fractional_factorial(df: pd.DataFrame, config: dict) -> AnalysisResult:
 
     base_k = k - p
     base_runs = 2 ** base_k
-
-    # Generate base design for (k-p) factors
-    base_design = list(product([-1, 1], repeat=base_k))
-
-    # Generate remaining factors using highest-order interactions
-    full_design = []
-    for run in base_design:
-        row = list(run)
-        for gen_idx in range(p):
-            # Use product of base columns as generator
-            # Simple generator: last factor = product of first (base_k) factors
-            generated = 1
-            for val in run[:base_k - gen_idx]:
-                generated *= val
-            row.append(generated)
-        full_design.append(tuple(row))
+    full_design = _fractional_matrix(k, p)
 
     # Expand for replicates
-    full_design = full_design * replicates
-
-    # Randomize and build table
-    rng = np.random.default_rng(42)
-    run_order = list(range(len(full_design)))
-    rng.shuffle(run_order)
-
-    design_table = []
-    for idx, orig_idx in enumerate(run_order):
-        coded = full_design[orig_idx]
-        entry = {"run_order": idx + 1, "std_order": orig_idx + 1}
-        for j, name in enumerate(factor_names):
-            low, high = factors[name]
-            entry[name] = low if coded[j] == -1 else high
-        entry["coded"] = {factor_names[j]: coded[j] for j in range(k)}
-        design_table.append(entry)
+    coded = np.tile(full_design, (replicates, 1))
+
+    lows = np.array([factors[f][0] for f in factor_names], dtype=object)
+    highs = np.array([factors[f][1] for f in factor_names], dtype=object)
+    design_table = _design_table(factor_names, np.where(coded == -1, lows, highs), coded)
 
     resolution = base_k - p + 1  # rough estimate
 
@@ -227,6 +250,216 @@ def fractional_factorial(df: pd.DataFrame, config: dict) -> AnalysisResult:
 # DOE Analysis (Analyze factorial experiment results)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=32)
+def _anova_layout(n_levels: tuple[int, ...]) -> tuple[tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]], ...]:
+    """
+    Column layout of a treatment-coded factorial model with all main effects
+    and two-way interactions, keyed only by the level count of each factor.
+
+    Column 0 is the intercept, followed by (L - 1) dummies per factor, then the
+    pairwise dummy products. Each entry is (term, term_cols, containing_cols),
+    where containing_cols belong to the higher-order terms that contain it.
+    """
+    terms: list[tuple[int, ...]] = [(i,) for i in range(len(n_levels))]
+    terms += list(combinations(range(len(n_levels)), 2))
+    spans: dict[tuple[int, ...], tuple[int, ...]] = {}
+    start = 1
+    for term in terms:
+        width = int(np.prod([n_levels[i] - 1 for i in term]))
+        spans[term] = tuple(range(start, start + width))
+        start += width
+
+    return tuple(
+        (term, spans[term], tuple(c for t in terms if set(term) < set(t) for c in spans[t]))
+        for term in terms
+    )
+
+
+def _factorial_anova(
+    y: np.ndarray, str_factors: dict[str, pd.Series], alpha: float,
+) -> tuple[dict[str, dict], float, float, float, int]:
+    """
+    Type II ANOVA for main effects + two-way interactions of categorical factors.
+
+    Same result as anova_lm(ols("y ~ C(a) + C(b) + C(a):C(b)"), typ=2), but
+    the dummy design is built directly from factorized codes and the per-term
+    Wald tests are evaluated with NumPy, so there is no formula parsing or
+    statsmodels model construction per call. Like statsmodels, the fit uses
+    the pseudo-inverse, so aliased (fractional) designs are handled the same.
+    Factors arrive already cast to str, keyed by column name in model order.
+    Returns (effects, r_squared, adj_r_squared, ssr, df_resid).
+    """
+    factor_cols = list(str_factors)
+    n = len(y)
+    dummies = []
+    n_levels = []
+    for factor in factor_cols:
+        codes, levels = pd.factorize(str_factors[factor], sort=True)
+        n_levels.append(len(levels))
+        dummies.append((codes[:, None] == np.arange(1, len(levels))).astype(float))
+    layout = _anova_layout(tuple(n_levels))
+
+    blocks = [np.ones((n, 1))] + dummies
+    for term, _, _ in layout[len(factor_cols):]:
+        a, b = dummies[term[0]], dummies[term[1]]
+        # patsy column order: the first factor's dummies vary fastest
+        blocks.append((b[:, :, None] * a[:, None, :]).reshape(n, -1))
+    X = np.hstack(blocks)
+
+    pinv_x = np.linalg.pinv(X, rcond=1e-15)
+    params = pinv_x @ y
+    resid = y - X @ params
+    ssr = float(resid @ resid)
+    df_resid = n - np.linalg.matrix_rank(X)
+    if df_resid <= 0:
+        raise ValueError("No residual degrees of freedom: the model is saturated")
+    scale = ssr / df_resid
+    cov = scale * (pinv_x @ pinv_x.T)
+    eye = np.eye(X.shape[1])
+
+    effects = {}
+    for term, term_cols, containing_cols in layout:
+        r = len(term_cols)
+        label = ":".join(factor_cols[i] for i in term)
+        if r == 0:
+            effects[label] = {"sum_sq": 0.0, "df": 0.0, "F": None, "p_value": None, "significant": False}
+            continue
+
+        # Test the term with higher-order terms containing it partialled out
+        L1 = eye[list(term_cols + containing_cols)]
+        if containing_cols:
+            L2 = eye[list(containing_cols)]
+            orth_compl, _ = linalg.qr(L1 @ cov @ L2.T)
+            L = orth_compl[:, -r:].T @ L1
+        else:
+            L = L1
+        effect = L @ params
+        cov_effect = L @ cov @ L.T
+        n_constraints = min(r, int(np.linalg.matrix_rank(cov_effect)))
+        # Zero-rank covariance (exact fit, zero residual): untestable, NaN like statsmodels
+        f_val = float(effect @ np.linalg.pinv(cov_effect) @ effect) / n_constraints if n_constraints else np.nan
+        p_val = float(sp_stats.f.sf(f_val, n_constraints, df_resid))
+        sum_sq = float(f_val * r * scale)
+        effects[label] = {
+            "sum_sq": sum_sq if not np.isnan(sum_sq) else None,
+            "df": float(r),
+            "F": f_val if not np.isnan(f_val) else None,
+            "p_value": p_val if not np.isnan(p_val) else None,
+            "significant": p_val < alpha,
+        }
+
+    r_squared = 1 - ssr / float(np.sum((y - y.mean()) ** 2))
+    adj_r_squared = 1 - (n - 1) / df_resid * (1 - r_squared)
+    return effects, float(r_squared), float(adj_r_squared), ssr, int(df_resid)
+
+
+def _yates_anova(
+    y: np.ndarray, str_factors: dict[str, pd.Series], alpha: float,
+) -> tuple[dict[str, dict], float, float, float, int] | None:
+    """
+    Closed-form ANOVA for a balanced two-level full factorial.
+
+    When every factor has exactly two levels and every one of the 2^k
+    treatment combinations is run equally often, all effect contrasts are
+    orthogonal: Yates' algorithm (k butterfly passes over the cell totals)
+    yields every contrast at once, and each effect's sum of squares is
+    contrast^2 / n, identical to the Type II result of _factorial_anova.
+    Returns None for any other design so the caller falls back to the
+    general fit.
+    """
+    factor_cols = list(str_factors)
+    k = len(factor_cols)
+    n = len(y)
+    n_cells = 2 ** k
+    if n % n_cells:
+        return None
+
+    # Cell index with bit i set when factor i is at its (sorted) high level
+    cell = np.zeros(n, dtype=np.int64)
+    for i, factor in enumerate(factor_cols):
+        codes, levels = pd.factorize(str_factors[factor], sort=True)
+        if len(levels) != 2:
+            return None
+        cell |= codes.astype(np.int64) << i
+    if not np.all(np.bincount(cell, minlength=n_cells) == n // n_cells):
+        return None
+
+    # Yates' algorithm: pass i pairs cells that differ only in bit i, after
+    # which position j holds the contrast of the effect with bitmask j
+    contrasts = np.bincount(cell, weights=y, minlength=n_cells)
+    for i in range(k):
+        stride = 2 ** i
+        pairs = contrasts.reshape(-1, 2, stride)
+        contrasts = np.concatenate(
+            [pairs[:, 0] + pairs[:, 1], pairs[:, 1] - pairs[:, 0]], axis=1,
+        ).ravel()
+
+    layout = _anova_layout((2,) * k)
+    masks = [sum(1 << i for i in term) for term, _, _ in layout]
+    sum_sq = contrasts[masks] ** 2 / n
+    df_resid = n - 1 - len(masks)
+    if df_resid <= 0:
+        raise ValueError("No residual degrees of freedom: the model is saturated")
+
+    # Residual SS from the fitted cell means (grand mean plus each modelled
+    # effect's +/-1 column times its coefficient), never as SST - sum(SS),
+    # which cancels to zero or below on (near-)exact fits
+    bits = (np.arange(n_cells)[:, None] >> np.arange(k)) & 1
+    signs = np.stack([np.prod(2 * bits[:, list(term)] - 1, axis=1) for term, _, _ in layout], axis=1)
+    fitted = contrasts[0] / n + signs @ (contrasts[masks] / n)
+    resid = y - fitted[cell]
+    ssr = float(resid @ resid)
+    sst = float(np.sum((y - y.mean()) ** 2))
+    if ssr <= np.finfo(float).eps * sst:
+        # Exact fit: F is unbounded; leave it to the general fit, which
+        # reports it the way statsmodels does
+        return None
+    scale = ssr / df_resid
+    f_vals = sum_sq / scale
+    p_vals = sp_stats.f.sf(f_vals, 1, df_resid)
+
+    effects = {}
+    for (term, _, _), ss, f_val, p_val in zip(layout, sum_sq.tolist(), f_vals.tolist(), p_vals.tolist()):
+        effects[":".join(factor_cols[i] for i in term)] = {
+            "sum_sq": ss,
+            "df": 1.0,
+            "F": f_val if not np.isnan(f_val) else None,
+            "p_value": p_val if not np.isnan(p_val) else None,
+            "significant": p_val < alpha,
+        }
+
+    r_squared = 1 - ssr / sst
+    adj_r_squared = 1 - (n - 1) / df_resid * (1 - r_squared)
+    return effects, float(r_squared), float(adj_r_squared), ssr, int(df_resid)
+
+
+def _str_levels(col: pd.Series) -> pd.Series:
+    """
+    col.astype(str) as a categorical with lexically sorted categories. Only
+    the distinct values are converted to str, and the anova fits and
+    groupbys downstream work from the integer codes.
+    """
+    codes, uniques = pd.factorize(col)
+    labels, inverse = np.unique(np.asarray(uniques.astype(str), dtype=object), return_inverse=True)
+    return pd.Series(
+        pd.Categorical.from_codes(inverse.ravel()[codes], categories=labels),
+        index=col.index, name=col.name,
+    )
+
+
+def factorial_anova(
+    y: np.ndarray, str_factors: dict[str, pd.Series], alpha: float,
+) -> tuple[dict, float, float, float, int]:
+    """
+    Type II ANOVA of y on all main effects and two-way interactions of the
+    given (str-cast) factors, with effects labelled by their dict keys.
+    Balanced two-level full factorials use Yates' algorithm; anything else
+    gets the general fit. Also used by comparison.two_way_anova.
+    Returns (effects, r_squared, adj_r_squared, ssr, df_resid).
+    """
+    return _yates_anova(y, str_factors, alpha) or _factorial_anova(y, str_factors, alpha)
+
+
 def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
     """
     Analyze results from a factorial experiment.
@@ -253,7 +486,7 @@ def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="doe_analysis", test_category="doe", success=False,
                               summary={}, details={"error": "Need at least 1 factor column"})
 
-    clean = df[[response_col] + factor_cols].dropna()
+    clean = drop_incomplete(df[[response_col] + factor_cols])
     n = len(clean)
     warnings: list[str] = []
 
@@ -262,68 +495,22 @@ def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"Need at least 4 observations, got {n}"})
 
     try:
-        import statsmodels.api as sm
-        from statsmodels.formula.api import ols
-
-        # Sanitize column names
-        col_map = {}
-        safe_response = "Y_response"
-        col_map[response_col] = safe_response
-        safe_factors = []
-        for i, f in enumerate(factor_cols):
-            safe = f"F{i}"
-            col_map[f] = safe
-            safe_factors.append(safe)
-
-        formula_df = clean.rename(columns=col_map)
-        formula_df[safe_response] = formula_df[safe_response].astype(float)
-        for sf in safe_factors:
-            formula_df[sf] = formula_df[sf].astype(str)
-
-        # Build formula with main effects and two-way interactions
-        main_terms = [f"C({sf})" for sf in safe_factors]
-        interaction_terms = []
-        if len(safe_factors) >= 2:
-            for i in range(len(safe_factors)):
-                for j in range(i + 1, len(safe_factors)):
-                    interaction_terms.append(f"C({safe_factors[i]}):C({safe_factors[j]})")
-
-        formula = f"{safe_response} ~ " + " + ".join(main_terms + interaction_terms)
-        model = ols(formula, data=formula_df).fit()
-        anova_table = sm.stats.anova_lm(model, typ=2)
-
-        # Parse ANOVA results
-        effects = {}
-        for idx in anova_table.index:
-            if idx == "Residual":
-                continue
-            row = anova_table.loc[idx]
-            f_val = float(row.get("F", 0)) if not pd.isna(row.get("F")) else None
-            p_val = float(row.get("PR(>F)", 1)) if not pd.isna(row.get("PR(>F)")) else None
-
-            # Map back to original names
-            label = str(idx)
-            for safe, orig in zip(safe_factors, factor_cols):
-                label = label.replace(f"C({safe})", orig)
-
-            effects[label] = {
-                "sum_sq": float(row.get("sum_sq", 0)),
-                "df": float(row.get("df", 0)),
-                "F": f_val,
-                "p_value": p_val,
-                "significant": p_val < alpha if p_val is not None else False,
-            }
+        # Factors are cast to str levels and the response to float once, then
+        # shared by the ANOVA fit and the plot aggregations below
+        y = clean[response_col].astype(float)
+        str_factors = {factor: _str_levels(clean[factor]) for factor in factor_cols}
+
+        effects, r_squared, adj_r_squared, _, _ = factorial_anova(y.to_numpy(), str_factors, alpha)
 
         significant_effects = [name for name, e in effects.items() if e["significant"]]
 
-        # Main effects plot
+        # Main effects plot — one sorted groupby per factor
         factor_levels_dict: dict[str, list] = {}
         factor_means_dict: dict[str, list[float]] = {}
         for factor in factor_cols:
-            levels = sorted(clean[factor].astype(str).unique())
-            factor_levels_dict[factor] = levels
-            means = [float(clean[clean[factor].astype(str) == lvl][response_col].astype(float).mean()) for lvl in levels]
-            factor_means_dict[factor] = means
+            level_means = y.groupby(str_factors[factor], sort=True, observed=True).mean()
+            factor_levels_dict[factor] = level_means.index.tolist()
+            factor_means_dict[factor] = level_means.tolist()
 
         chart_list = [
             charts.main_effects_plot(
@@ -338,16 +525,18 @@ def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
         # Interaction plot for first two factors (if >= 2 factors)
         if len(factor_cols) >= 2:
             f1, f2 = factor_cols[0], factor_cols[1]
-            f1_levels = sorted(clean[f1].astype(str).unique())
-            f2_levels = sorted(clean[f2].astype(str).unique())
-
-            int_means: dict[str, list[float]] = {}
-            for f2_lvl in f2_levels:
-                means = []
-                for f1_lvl in f1_levels:
-                    subset = clean[(clean[f1].astype(str) == f1_lvl) & (clean[f2].astype(str) == f2_lvl)]
-                    means.append(float(subset[response_col].astype(float).mean()) if len(subset) > 0 else 0)
-                int_means[f2_lvl] = means
+            f1_levels = factor_levels_dict[f1]
+            f2_levels = factor_levels_dict[f2]
+
+            # Empty cells plot as 0, as before
+            cell_means = (
+                y.groupby([str_factors[f1], str_factors[f2]], sort=True, observed=True).mean()
+                .unstack(fill_value=0.0)
+                .reindex(index=f1_levels, columns=f2_levels, fill_value=0.0)
+            )
+            int_means: dict[str, list[float]] = {
+                f2_lvl: cell_means[f2_lvl].tolist() for f2_lvl in f2_levels
+            }
 
             chart_list.append(charts.interaction_plot(
                 x_levels=f1_levels,
@@ -360,24 +549,23 @@ def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
             ))
 
         # Pareto of effects (absolute effect sizes)
-        effect_sizes = []
-        for name, e in effects.items():
-            if e["F"] is not None:
-                effect_sizes.append((name, abs(e["F"])))
-        effect_sizes.sort(key=lambda x: x[1], reverse=True)
+        effect_names = np.array([name for name, e in effects.items() if e["F"] is not None], dtype=object)
+        abs_f = np.abs(np.array([e["F"] for e in effects.values() if e["F"] is not None], dtype=float))
+        # Stable on -|F| so tied effects keep their model order
+        order = np.argsort(-abs_f, kind="stable")
 
-        if effect_sizes:
+        if len(order):
             chart_list.append(charts.bar_chart(
-                categories=[e[0] for e in effect_sizes],
-                values=[e[1] for e in effect_sizes],
+                categories=effect_names[order].tolist(),
+                values=abs_f[order].tolist(),
                 title="Pareto of Standardized Effects (|F-statistic|)",
                 yaxis_title="|F|",
                 orientation="h",
             ))
 
         summary = {
-            "r_squared": float(model.rsquared),
-            "adj_r_squared": float(model.rsquared_adj),
+            "r_squared": r_squared,
+            "adj_r_squared": adj_r_squared,
             "effects": effects,
             "significant_effects": significant_effects,
             "n": n,
@@ -394,7 +582,7 @@ def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
                 "factor_columns": factor_cols,
                 "alpha": alpha,
                 "anova_effects": effects,
-                "r_squared": float(model.rsquared),
+                "r_squared": r_squared,
             },
             charts=chart_list,
             interpretation_context={
@@ -402,12 +590,12 @@ def doe_analysis(df: pd.DataFrame, config: dict) -> AnalysisResult:
                 "response_column": response_col,
                 "factor_columns": factor_cols,
                 "significant_effects": significant_effects,
-                "r_squared": float(model.rsquared),
-                "r_squared_pct": round(float(model.rsquared) * 100, 1),
+                "r_squared": r_squared,
+                "r_squared_pct": round(r_squared * 100, 1),
                 "alpha": alpha,
                 "recommendation": (
                     f"Significant effects: {', '.join(significant_effects)}. "
-                    f"Model explains {model.rsquared * 100:.1f}% of variation."
+                    f"Model explains {r_squared * 100:.1f}% of variation."
                     if significant_effects else
                     "No statistically significant effects found at the chosen alpha level."
                 ),
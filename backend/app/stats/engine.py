@@ -17,8 +17,11 @@ Flow:
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 import io
 import time
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from typing import Callable
 from uuid import UUID
@@ -29,17 +32,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.analysis import Dataset, StatisticalAnalysis
 from app.stats import AnalysisResult
+from app.stats.datasets import dataset_to_dataframe
+from app.stats.pool import discard_process_pool, get_process_pool, run_on_dataset
 from app.stats.validator import run_full_validation
 
-# Import all test modules — triggers registration
-from app.stats import descriptive, comparison, regression, spc, capability, doe
-
 
 # ---------------------------------------------------------------------------
 # Test registry
 # ---------------------------------------------------------------------------
 
-_TEST_RUNNERS: dict[str, Callable] = {}
+_TEST_RUNNERS: dict[str, Callable[[pd.DataFrame, dict], AnalysisResult]] = {}
 
 
 def register_test(test_type: str):
@@ -52,106 +54,207 @@ def register_test(test_type: str):
 
 def get_available_tests() -> list[str]:
     """Return list of registered test types."""
-    return list(_TEST_RUNNERS.keys())
+    return list(dict.fromkeys([*_LAZY_TESTS, *_TEST_RUNNERS]))
 
 
-# ---------------------------------------------------------------------------
-# Dataset → DataFrame conversion
-# ---------------------------------------------------------------------------
-
-def _dataset_to_dataframe(dataset_data: dict | None) -> pd.DataFrame:
+def _get_runner(test_type: str) -> Callable[[pd.DataFrame, dict], AnalysisResult] | None:
     """
-    Reconstruct a pandas DataFrame from stored dataset metadata.
-
-    Priority:
-      1. file_path — read the original uploaded file (full dataset)
-      2. data_preview — fallback to the stored preview rows (first 50)
-
-    When file storage is wired up (Atlas agent), file_path will point
-    to the original CSV/Excel on S3/Supabase Storage.
+    Resolve a test implementation, importing its module on first use and
+    caching the function in _TEST_RUNNERS. Returns None for unknown types.
     """
-    if dataset_data is None:
-        return pd.DataFrame()
-
-    # Try full file first
-    file_path = dataset_data.get("file_path")
-    if file_path:
-        try:
-            if file_path.lower().endswith((".xlsx", ".xls")):
-                return pd.read_excel(file_path)
-            else:
-                return pd.read_csv(file_path)
-        except Exception:
-            pass  # Fall through to preview
-
-    # Fallback: reconstruct from preview rows (JSON records)
-    preview = dataset_data.get("data_preview")
-    if preview and isinstance(preview, list) and len(preview) > 0:
-        return pd.DataFrame(preview)
-
-    return pd.DataFrame()
+    runner = _TEST_RUNNERS.get(test_type)
+    if runner is None and test_type in _LAZY_TESTS:
+        module_name, func_name = _LAZY_TESTS[test_type]
+        runner = getattr(importlib.import_module(module_name), func_name)
+        _TEST_RUNNERS[test_type] = runner
+    return runner
 
 
 # ---------------------------------------------------------------------------
 # Register all 27 test implementations
 #
-# Each wrapper converts the engine's (configuration, dataset) signature
-# to Sigma's (df, config) signature used by the test functions.
+# Test functions share the (df, config) -> AnalysisResult signature and are
+# registered by module path; _get_runner imports a module the first time one
+# of its tests is dispatched, so a worker only loads the scipy/statsmodels
+# stack its tests actually use. execute_analysis runs them in a worker
+# thread so the CPU-bound work never blocks the event loop.
 # ---------------------------------------------------------------------------
 
-def _make_runner(test_fn: Callable[[pd.DataFrame, dict], AnalysisResult]):
-    """Create an async runner that bridges engine ↔ test function."""
-    async def runner(configuration: dict, dataset: dict | None) -> AnalysisResult:
-        df = _dataset_to_dataframe(dataset)
-        return test_fn(df, configuration)
-    return runner
-
-
-# -- Descriptive -----------------------------------------------------------
-_TEST_RUNNERS["descriptive_summary"] = _make_runner(descriptive.descriptive_summary)
-_TEST_RUNNERS["normality_test"] = _make_runner(descriptive.normality_test)
-_TEST_RUNNERS["pareto_analysis"] = _make_runner(descriptive.pareto_analysis)
-
-# -- Comparison ------------------------------------------------------------
-_TEST_RUNNERS["one_sample_t"] = _make_runner(comparison.one_sample_t)
-_TEST_RUNNERS["two_sample_t"] = _make_runner(comparison.two_sample_t)
-_TEST_RUNNERS["paired_t"] = _make_runner(comparison.paired_t)
-_TEST_RUNNERS["one_way_anova"] = _make_runner(comparison.one_way_anova)
-_TEST_RUNNERS["two_way_anova"] = _make_runner(comparison.two_way_anova)
-_TEST_RUNNERS["mann_whitney"] = _make_runner(comparison.mann_whitney)
-_TEST_RUNNERS["kruskal_wallis"] = _make_runner(comparison.kruskal_wallis)
-_TEST_RUNNERS["chi_square_association"] = _make_runner(comparison.chi_square_association)
-_TEST_RUNNERS["chi_square_goodness"] = _make_runner(comparison.chi_square_goodness)
-
-# -- Correlation & Regression ----------------------------------------------
-_TEST_RUNNERS["correlation"] = _make_runner(regression.correlation)
-_TEST_RUNNERS["simple_regression"] = _make_runner(regression.simple_regression)
-_TEST_RUNNERS["multiple_regression"] = _make_runner(regression.multiple_regression)
-_TEST_RUNNERS["logistic_regression"] = _make_runner(regression.logistic_regression)
-
-# -- SPC -------------------------------------------------------------------
-_TEST_RUNNERS["i_mr_chart"] = _make_runner(spc.i_mr_chart)
-_TEST_RUNNERS["xbar_r_chart"] = _make_runner(spc.xbar_r_chart)
-_TEST_RUNNERS["p_chart"] = _make_runner(spc.p_chart)
-_TEST_RUNNERS["np_chart"] = _make_runner(spc.np_chart)
-_TEST_RUNNERS["c_chart"] = _make_runner(spc.c_chart)
-_TEST_RUNNERS["u_chart"] = _make_runner(spc.u_chart)
-
-# -- Capability & MSA ------------------------------------------------------
-_TEST_RUNNERS["capability_normal"] = _make_runner(capability.capability_normal)
-_TEST_RUNNERS["capability_nonnormal"] = _make_runner(capability.capability_nonnormal)
-_TEST_RUNNERS["msa_gage_rr"] = _make_runner(capability.msa_gage_rr)
-
-# -- DOE -------------------------------------------------------------------
-_TEST_RUNNERS["full_factorial"] = _make_runner(doe.full_factorial)
-_TEST_RUNNERS["fractional_factorial"] = _make_runner(doe.fractional_factorial)
-_TEST_RUNNERS["doe_analysis"] = _make_runner(doe.doe_analysis)
+_LAZY_TESTS: dict[str, tuple[str, str]] = {
+    # -- Descriptive -------------------------------------------------------
+    "descriptive_summary": ("app.stats.descriptive", "descriptive_summary"),
+    "normality_test": ("app.stats.descriptive", "normality_test"),
+    "pareto_analysis": ("app.stats.descriptive", "pareto_analysis"),
+
+    # -- Comparison --------------------------------------------------------
+    "one_sample_t": ("app.stats.comparison", "one_sample_t"),
+    "two_sample_t": ("app.stats.comparison", "two_sample_t"),
+    "paired_t": ("app.stats.comparison", "paired_t"),
+    "one_way_anova": ("app.stats.comparison", "one_way_anova"),
+    "two_way_anova": ("app.stats.comparison", "two_way_anova"),
+    "mann_whitney": ("app.stats.comparison", "mann_whitney"),
+    "kruskal_wallis": ("app.stats.comparison", "kruskal_wallis"),
+    "chi_square_association": ("app.stats.comparison", "chi_square_association"),
+    "chi_square_goodness": ("app.stats.comparison", "chi_square_goodness"),
+
+    # -- Correlation & Regression ------------------------------------------
+    "correlation": ("app.stats.regression", "correlation"),
+    "simple_regression": ("app.stats.regression", "simple_regression"),
+    "simple_regression_batch": ("app.stats.regression", "simple_regression_batch"),
+    "multiple_regression": ("app.stats.regression", "multiple_regression"),
+    "logistic_regression": ("app.stats.regression", "logistic_regression"),
+
+    # -- SPC ---------------------------------------------------------------
+    "i_mr_chart": ("app.stats.spc", "i_mr_chart"),
+    "i_mr_chart_batch": ("app.stats.spc", "i_mr_chart_batch"),
+    "xbar_r_chart": ("app.stats.spc", "xbar_r_chart"),
+    "p_chart": ("app.stats.spc", "p_chart"),
+    "np_chart": ("app.stats.spc", "np_chart"),
+    "c_chart": ("app.stats.spc", "c_chart"),
+    "u_chart": ("app.stats.spc", "u_chart"),
+
+    # -- Capability & MSA --------------------------------------------------
+    "capability_normal": ("app.stats.capability", "capability_normal"),
+    "capability_nonnormal": ("app.stats.capability", "capability_nonnormal"),
+    "msa_gage_rr": ("app.stats.capability", "msa_gage_rr"),
+
+    # -- DOE ---------------------------------------------------------------
+    "full_factorial": ("app.stats.doe", "full_factorial"),
+    "fractional_factorial": ("app.stats.doe", "fractional_factorial"),
+    "doe_analysis": ("app.stats.doe", "doe_analysis"),
+}
 
 
 # ---------------------------------------------------------------------------
 # Main execution entry point
 # ---------------------------------------------------------------------------
 
+def _load_validator_agent():
+    """Import and construct the Layer 2 AI validator (lazy: pulls in the SDK)."""
+    from app.agents.stats_validator import StatsValidatorAgent
+    return StatsValidatorAgent()
+
+
+def _dataset_data(dataset: Dataset) -> dict:
+    """Dataset metadata handed to the runner, validators and AI review."""
+    return {
+        "columns": dataset.columns,
+        "summary_stats": dataset.summary_stats,
+        "data_preview": dataset.data_preview,
+        "file_path": dataset.file_path,
+        "row_count": dataset.row_count,
+    }
+
+
+def _store_result(analysis: StatisticalAnalysis, test_result: AnalysisResult, elapsed_ms: int) -> None:
+    """Copy a test result onto its analysis record."""
+    analysis.status = "completed" if test_result.success else "failed"
+    analysis.results = test_result.summary | {"details": test_result.details}
+    # Chart fields already hold plain JSON lists/dicts, so a shallow field
+    # dict stores the same document as model_dump() without walking and
+    # copying every trace point.
+    analysis.charts = {
+        "charts": [dict(c) for c in test_result.charts]
+    } if test_result.charts else None
+    analysis.duration_ms = elapsed_ms
+
+    if test_result.warnings:
+        analysis.results["warnings"] = test_result.warnings
+
+    # Store interpretation context for Stats Advisor AI
+    if test_result.interpretation_context:
+        analysis.results["interpretation_context"] = test_result.interpretation_context
+
+
+async def _validate(
+    analysis: StatisticalAnalysis,
+    dataset_data: dict | None,
+    test_result: AnalysisResult,
+    df: pd.DataFrame,
+) -> None:
+    """Dual-layer validation: programmatic checks + AI review, stored on the record."""
+    try:
+        # Layer 1 (programmatic, CPU-bound) runs in a worker thread while the
+        # Layer 2 agent is imported and its API client built in another; the
+        # AI review itself needs the programmatic report, so it goes last.
+        programmatic_report, validator_agent = await asyncio.gather(
+            asyncio.to_thread(
+                run_full_validation,
+                test_type=analysis.test_type,
+                configuration=analysis.configuration,
+                dataset_summary=dataset_data,
+                result=test_result,
+                df=df if not df.empty else None,
+            ),
+            asyncio.to_thread(_load_validator_agent),
+            return_exceptions=True,
+        )
+        if isinstance(programmatic_report, BaseException):
+            raise programmatic_report
+
+        validation_result: dict = {
+            "overall_verdict": "validated" if programmatic_report.passed else "concern",
+            "overall_confidence": programmatic_report.confidence,
+            "programmatic": programmatic_report.to_dict(),
+        }
+
+        # Layer 2: AI validation review
+        try:
+            if isinstance(validator_agent, BaseException):
+                raise validator_agent
+            ai_review = await validator_agent.review_analysis(
+                test_type=analysis.test_type,
+                configuration=analysis.configuration,
+                dataset_profile=dataset_data,
+                result_summary=test_result.summary,
+                result_details=test_result.details,
+                programmatic_report=programmatic_report.to_dict(),
+            )
+            validation_result["ai_review"] = ai_review
+
+            # Use AI verdict as overall if programmatic passed
+            if programmatic_report.passed:
+                validation_result["overall_verdict"] = ai_review.get("verdict", "validated")
+                # Map AI confidence score to confidence level
+                ai_score = ai_review.get("confidence_score", 50)
+                if ai_score >= 75:
+                    validation_result["overall_confidence"] = "high"
+                elif ai_score >= 50:
+                    validation_result["overall_confidence"] = "medium"
+                else:
+                    validation_result["overall_confidence"] = "low"
+
+        except Exception:
+            # AI review is optional — programmatic results still valid
+            validation_result["ai_review"] = {
+                "verdict": "caution",
+                "confidence_score": 50,
+                "plain_language_summary": "AI review unavailable. Programmatic validation completed.",
+                "findings": [],
+                "recommendation": "Review programmatic findings.",
+            }
+
+        analysis.results["validation"] = validation_result
+
+    except Exception:
+        # Validation should never block test results
+        pass
+
+
+async def _publish_completed(analysis: StatisticalAnalysis) -> None:
+    """Publish ANALYSIS_COMPLETED for the workflow chain (Stats Advisor AI interpretation)."""
+    try:
+        from app.services.event_bus import ANALYSIS_COMPLETED, get_event_bus
+        bus = get_event_bus()
+        await bus.publish(ANALYSIS_COMPLETED, {
+            "analysis_id": str(analysis.id),
+            "initiative_id": str(analysis.initiative_id) if analysis.initiative_id else None,
+            "test_type": analysis.test_type,
+        })
+    except (RuntimeError, ImportError):
+        pass  # EventBus not initialized or not available
+
+
 async def execute_analysis(analysis_id: UUID, db: AsyncSession) -> AnalysisResult:
     """
     Execute a statistical analysis.
@@ -168,7 +271,7 @@ async def execute_analysis(analysis_id: UUID, db: AsyncSession) -> AnalysisResul
         raise ValueError(f"Analysis {analysis_id} not found")
 
     # Check if test type is registered
-    runner = _TEST_RUNNERS.get(analysis.test_type)
+    runner = await asyncio.to_thread(_get_runner, analysis.test_type)
     if runner is None:
         analysis.status = "failed"
         analysis.results = {
@@ -189,13 +292,7 @@ async def execute_analysis(analysis_id: UUID, db: AsyncSession) -> AnalysisResul
         )
         dataset = ds_result.scalar_one_or_none()
         if dataset:
-            dataset_data = {
-                "columns": dataset.columns,
-                "summary_stats": dataset.summary_stats,
-                "data_preview": dataset.data_preview,
-                "file_path": dataset.file_path,
-                "row_count": dataset.row_count,
-            }
+            dataset_data = _dataset_data(dataset)
 
     # Execute the test
     analysis.status = "running"
@@ -204,102 +301,15 @@ async def execute_analysis(analysis_id: UUID, db: AsyncSession) -> AnalysisResul
 
     start = time.perf_counter()
     try:
-        test_result: AnalysisResult = await runner(
-            configuration=analysis.configuration,
-            dataset=dataset_data,
-        )
+        # Loaded once and shared by the test runner and programmatic validation
+        df = await asyncio.to_thread(dataset_to_dataframe, dataset_data)
+        test_result: AnalysisResult = await asyncio.to_thread(runner, df, analysis.configuration)
         elapsed_ms = int((time.perf_counter() - start) * 1000)
 
-        # Store results
-        analysis.status = "completed" if test_result.success else "failed"
-        analysis.results = test_result.summary | {"details": test_result.details}
-        analysis.charts = {
-            "charts": [c.model_dump() for c in test_result.charts]
-        } if test_result.charts else None
-        analysis.duration_ms = elapsed_ms
-
-        if test_result.warnings:
-            analysis.results["warnings"] = test_result.warnings
-
-        # Store interpretation context for Stats Advisor AI
-        if test_result.interpretation_context:
-            analysis.results["interpretation_context"] = test_result.interpretation_context
-
-        # -----------------------------------------------------------
-        # Dual-layer validation
-        # -----------------------------------------------------------
-        try:
-            # Layer 1: Programmatic validation (instant, no AI cost)
-            df = _dataset_to_dataframe(dataset_data)
-            programmatic_report = run_full_validation(
-                test_type=analysis.test_type,
-                configuration=analysis.configuration,
-                dataset_summary=dataset_data,
-                result=test_result,
-                df=df if not df.empty else None,
-            )
-
-            validation_result: dict = {
-                "overall_verdict": "validated" if programmatic_report.passed else "concern",
-                "overall_confidence": programmatic_report.confidence,
-                "programmatic": programmatic_report.to_dict(),
-            }
-
-            # Layer 2: AI validation review
-            try:
-                from app.agents.stats_validator import StatsValidatorAgent
-                validator_agent = StatsValidatorAgent()
-                ai_review = await validator_agent.review_analysis(
-                    test_type=analysis.test_type,
-                    configuration=analysis.configuration,
-                    dataset_profile=dataset_data,
-                    result_summary=test_result.summary,
-                    result_details=test_result.details,
-                    programmatic_report=programmatic_report.to_dict(),
-                )
-                validation_result["ai_review"] = ai_review
-
-                # Use AI verdict as overall if programmatic passed
-                if programmatic_report.passed:
-                    validation_result["overall_verdict"] = ai_review.get("verdict", "validated")
-                    # Map AI confidence score to confidence level
-                    ai_score = ai_review.get("confidence_score", 50)
-                    if ai_score >= 75:
-                        validation_result["overall_confidence"] = "high"
-                    elif ai_score >= 50:
-                        validation_result["overall_confidence"] = "medium"
-                    else:
-                        validation_result["overall_confidence"] = "low"
-
-            except Exception:
-                # AI review is optional — programmatic results still valid
-                validation_result["ai_review"] = {
-                    "verdict": "caution",
-                    "confidence_score": 50,
-                    "plain_language_summary": "AI review unavailable. Programmatic validation completed.",
-                    "findings": [],
-                    "recommendation": "Review programmatic findings.",
-                }
-
-            analysis.results["validation"] = validation_result
-
-        except Exception:
-            # Validation should never block test results
-            pass
-
+        _store_result(analysis, test_result, elapsed_ms)
+        await _validate(analysis, dataset_data, test_result, df)
         await db.flush()
-
-        # Publish event for workflow chain (Stats Advisor AI interpretation)
-        try:
-            from app.services.event_bus import ANALYSIS_COMPLETED, get_event_bus
-            bus = get_event_bus()
-            await bus.publish(ANALYSIS_COMPLETED, {
-                "analysis_id": str(analysis_id),
-                "initiative_id": str(analysis.initiative_id) if analysis.initiative_id else None,
-                "test_type": analysis.test_type,
-            })
-        except (RuntimeError, ImportError):
-            pass  # EventBus not initialized or not available
+        await _publish_completed(analysis)
 
         return test_result
 
@@ -310,3 +320,86 @@ async def execute_analysis(analysis_id: UUID, db: AsyncSession) -> AnalysisResul
         analysis.duration_ms = elapsed_ms
         await db.flush()
         raise
+
+
+# ---------------------------------------------------------------------------
+# Batch execution (parameter sweeps, DOE runs)
+# ---------------------------------------------------------------------------
+
+async def execute_batch(analysis_ids: list[UUID], db: AsyncSession) -> list[AnalysisResult | None]:
+    """
+    Execute several analyses in parallel worker processes.
+
+    Analyses and their datasets are loaded with one query each, and the test
+    functions fan out to the shared process pool. Workers receive the dataset
+    dict rather than a pickled DataFrame and parse each file once through
+    their own load_file cache; the parent parses it once for validation. Results are stored and validated as in
+    execute_analysis; unknown test types and failed runs are recorded on
+    their analysis instead of raised. Returns results in analysis_ids order
+    (None where a run produced no result).
+    """
+    result = await db.execute(
+        select(StatisticalAnalysis).where(StatisticalAnalysis.id.in_(analysis_ids))
+    )
+    analyses = {a.id: a for a in result.scalars()}
+
+    datasets: dict = {}
+    dataset_ids = {a.dataset_id for a in analyses.values() if a.dataset_id}
+    if dataset_ids:
+        ds_result = await db.execute(select(Dataset).where(Dataset.id.in_(dataset_ids)))
+        datasets = {ds.id: _dataset_data(ds) for ds in ds_result.scalars()}
+    frames = {
+        ds_id: await asyncio.to_thread(dataset_to_dataframe, data)
+        for ds_id, data in datasets.items()
+    }
+
+    runnable = []
+    run_at = datetime.now(timezone.utc)
+    for analysis_id in analysis_ids:
+        analysis = analyses.get(analysis_id)
+        if analysis is None:
+            continue
+        runner = await asyncio.to_thread(_get_runner, analysis.test_type)
+        if runner is None:
+            analysis.status = "failed"
+            analysis.results = {
+                "error": f"Test type '{analysis.test_type}' not implemented",
+                "available_tests": get_available_tests(),
+            }
+            continue
+        analysis.status = "running"
+        analysis.run_at = run_at
+        runnable.append((analysis, runner))
+    await db.flush()
+
+    loop = asyncio.get_running_loop()
+    process_pool = get_process_pool()
+
+    async def run(analysis: StatisticalAnalysis, runner: Callable) -> AnalysisResult | None:
+        # Workers get the small dataset dict and rebuild the frame through
+        # their own file cache; the parsed frame is only used here for validation
+        df = frames.get(analysis.dataset_id, pd.DataFrame())
+        try:
+            test_result, elapsed_ms = await loop.run_in_executor(
+                process_pool, run_on_dataset, runner, datasets.get(analysis.dataset_id), analysis.configuration,
+            )
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker died (e.g. OOM kill); later batches get a fresh pool
+                discard_process_pool(process_pool)
+            analysis.status = "failed"
+            analysis.results = {"error": str(e)}
+            return None
+        _store_result(analysis, test_result, elapsed_ms)
+        await _validate(analysis, datasets.get(analysis.dataset_id), test_result, df)
+        return test_result
+
+    outcomes = await asyncio.gather(*(run(analysis, runner) for analysis, runner in runnable))
+    await db.flush()
+
+    for (analysis, _), test_result in zip(runnable, outcomes):
+        if test_result is not None:
+            await _publish_completed(analysis)
+
+    by_id = {analysis.id: test_result for (analysis, _), test_result in zip(runnable, outcomes)}
+    return [by_id.get(analysis_id) for analysis_id in analysis_ids]
@@ -0,0 +1,92 @@
+"""
+Process pool for running statistical tests in parallel.
+
+Kept free of heavy imports at module level: workers are spawned fresh and
+import this module first, so the BLAS/OpenMP thread caps below are in place
+before NumPy/SciPy load in the worker. One single-threaded BLAS per process
+avoids oversubscribing cores when every worker is busy.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+_BLAS_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def _init_worker() -> None:
+    """Pin each worker's numeric libraries to a single thread."""
+    for var in _BLAS_THREAD_VARS:
+        os.environ[var] = "1"
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Shared pool, created on first use and again after discard_process_pool.
+    Uses the spawn start method: forking the API process would copy its
+    event loop, DB connections and threads.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a pool that raised BrokenProcessPool so the next get_process_pool
+    starts fresh workers. A no-op if the pool was already replaced.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pool() -> None:
+    """Stop the workers at app shutdown; safe to call if no pool was created."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def timed_call(fn: Callable[..., Any], *args: Any) -> tuple[Any, int]:
+    """Run fn(*args) in the worker and return (result, elapsed_ms), excluding queue time."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, int((time.perf_counter() - start) * 1000)
+
+
+def run_on_dataset(
+    fn: Callable[..., Any], dataset_data: dict | None, config: dict,
+) -> tuple[Any, int]:
+    """
+    Rebuild the dataset's DataFrame in the worker, reusing the worker's own
+    load_file cache, then timed_call(fn, df, config). Only the small dataset
+    dict crosses the process boundary, not the parsed frame.
+    """
+    from app.stats.datasets import dataset_to_dataframe
+
+    return timed_call(fn, dataset_to_dataframe(dataset_data), config)
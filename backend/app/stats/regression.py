@@ -4,6 +4,7 @@ Correlation and regression analysis.
 Tests:
   - correlation: Pearson and Spearman correlation matrix
   - simple_regression: Single-predictor linear regression
+  - simple_regression_batch: Single-predictor fits for several predictors at once
   - multiple_regression: Multiple-predictor regression
   - logistic_regression: Binary outcome prediction
 """
@@ -12,16 +13,36 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
+import statsmodels.api as sm
+from scipy import special as sp_special
 from scipy import stats as sp_stats
+from statsmodels.stats.outliers_influence import variance_inflation_factor
 
 from app.stats import AnalysisResult, PlotlyChart
 from app.stats import charts
+from app.stats.datasets import drop_incomplete
 
 
 # ---------------------------------------------------------------------------
 # Correlation Matrix
 # ---------------------------------------------------------------------------
 
+def _corr_pvalues(r_matrix: np.ndarray, n: int) -> np.ndarray:
+    """
+    Two-sided p-values for a whole correlation matrix, from the t statistic
+    r * sqrt((n - 2) / (1 - r^2)) with n - 2 df — the same test pearsonr
+    and spearmanr apply pair by pair. Only the strict upper triangle is
+    evaluated and then mirrored; the diagonal is 0.
+    """
+    rows, cols = np.triu_indices(len(r_matrix), k=1)
+    r = r_matrix[rows, cols]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt((n - 2) / (1.0 - r * r))
+    p_matrix = np.zeros_like(r_matrix)
+    p_matrix[rows, cols] = p_matrix[cols, rows] = 2 * sp_stats.t.sf(np.abs(t), n - 2)
+    return p_matrix
+
+
 def correlation(df: pd.DataFrame, config: dict) -> AnalysisResult:
     """
     Compute Pearson and Spearman correlation matrices.
@@ -44,7 +65,7 @@ def correlation(df: pd.DataFrame, config: dict) -> AnalysisResult:
             summary={}, details={"error": "Need at least 2 numeric columns"},
         )
 
-    clean = numeric_df.dropna()
+    clean = drop_incomplete(numeric_df)
     warnings: list[str] = []
 
     if len(clean) < 3:
@@ -56,64 +77,60 @@ def correlation(df: pd.DataFrame, config: dict) -> AnalysisResult:
     results: dict = {"n": len(clean)}
     chart_list: list[PlotlyChart] = []
     col_names = clean.columns.tolist()
+    # One float64 block shared by both methods instead of per-method pandas
+    # conversions
+    mat = clean.to_numpy(dtype=np.float64)
+    pearson_matrix = spearman_matrix = None
 
     if method in ("pearson", "both"):
-        pearson_matrix = clean.corr(method="pearson")
-        # P-values for Pearson
-        p_matrix = np.zeros((len(col_names), len(col_names)))
-        for i, c1 in enumerate(col_names):
-            for j, c2 in enumerate(col_names):
-                if i == j:
-                    p_matrix[i][j] = 0.0
-                else:
-                    _, p = sp_stats.pearsonr(clean[c1], clean[c2])
-                    p_matrix[i][j] = p
+        pearson_matrix = np.clip(np.corrcoef(mat, rowvar=False), -1.0, 1.0)
+        p_matrix = _corr_pvalues(pearson_matrix, len(clean))
 
+        # Converted to nested lists once, shared by details and the heatmap
+        pearson_list = pearson_matrix.tolist()
         results["pearson"] = {
-            "correlations": pearson_matrix.values.tolist(),
+            "correlations": pearson_list,
             "p_values": p_matrix.tolist(),
         }
         chart_list.append(charts.heatmap(
-            matrix=pearson_matrix.values.tolist(),
+            matrix=pearson_list,
             labels=col_names,
             title="Pearson Correlation Matrix",
         ))
 
     if method in ("spearman", "both"):
-        spearman_matrix = clean.corr(method="spearman")
-        p_matrix = np.zeros((len(col_names), len(col_names)))
-        for i, c1 in enumerate(col_names):
-            for j, c2 in enumerate(col_names):
-                if i == j:
-                    p_matrix[i][j] = 0.0
-                else:
-                    _, p = sp_stats.spearmanr(clean[c1], clean[c2])
-                    p_matrix[i][j] = p
-
+        # Spearman is Pearson on average ranks: rank each column once, then
+        # reuse the matrix path (spearmanr applies the same t test). Ranking
+        # sorts each column, which is markedly faster when columns are
+        # contiguous in memory.
+        ranks = sp_stats.rankdata(np.asfortranarray(mat), axis=0)
+        spearman_matrix = np.clip(np.corrcoef(ranks, rowvar=False), -1.0, 1.0)
+        p_matrix = _corr_pvalues(spearman_matrix, len(clean))
+
+        spearman_list = spearman_matrix.tolist()
         results["spearman"] = {
-            "correlations": spearman_matrix.values.tolist(),
+            "correlations": spearman_list,
             "p_values": p_matrix.tolist(),
         }
         chart_list.append(charts.heatmap(
-            matrix=spearman_matrix.values.tolist(),
+            matrix=spearman_list,
             labels=col_names,
             title="Spearman Correlation Matrix",
         ))
 
-    # Find strongest correlations
+    # Find strongest correlations — one vectorized scan of each upper triangle
     strong_pairs = []
-    for method_name in ("pearson", "spearman"):
-        if method_name not in results:
+    rows, cols = np.triu_indices(len(col_names), k=1)
+    for method_name, corr in (("pearson", pearson_matrix), ("spearman", spearman_matrix)):
+        if corr is None:
             continue
-        corr = results[method_name]["correlations"]
-        for i in range(len(col_names)):
-            for j in range(i + 1, len(col_names)):
-                r = corr[i][j]
-                if abs(r) >= 0.5:
-                    strong_pairs.append({
-                        "var1": col_names[i], "var2": col_names[j],
-                        "r": round(r, 4), "method": method_name,
-                    })
+        r_vals = corr[rows, cols]
+        sel = np.abs(r_vals) >= 0.5
+        for i, j, r in zip(rows[sel].tolist(), cols[sel].tolist(), r_vals[sel].tolist()):
+            strong_pairs.append({
+                "var1": col_names[i], "var2": col_names[j],
+                "r": round(r, 4), "method": method_name,
+            })
     strong_pairs.sort(key=lambda x: abs(x["r"]), reverse=True)
 
     summary = {
@@ -144,16 +161,24 @@ def correlation(df: pd.DataFrame, config: dict) -> AnalysisResult:
 # Simple Linear Regression
 # ---------------------------------------------------------------------------
 
+def _durbin_watson(residuals: np.ndarray) -> float:
+    """Durbin-Watson statistic: sum of squared successive differences over the residual sum of squares."""
+    diff = np.diff(residuals)
+    return float((diff @ diff) / (residuals @ residuals))
+
+
 def simple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
     """
     Config:
-        y_column: str  — response variable
-        x_column: str  — predictor variable
-        alpha: float   — significance level (default: 0.05)
+        y_column: str        — response variable
+        x_column: str        — predictor variable
+        alpha: float         — significance level (default: 0.05)
+        include_charts: bool — build scatter/residual charts (default: True)
     """
     y_col = config.get("y_column")
     x_col = config.get("x_column")
     alpha = config.get("alpha", 0.05)
+    include_charts = config.get("include_charts", True)
 
     if not y_col or y_col not in df.columns:
         return AnalysisResult(test_type="simple_regression", test_category="regression", success=False,
@@ -162,7 +187,7 @@ def simple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="simple_regression", test_category="regression", success=False,
                               summary={}, details={"error": f"X column '{x_col}' not found"})
 
-    clean = df[[y_col, x_col]].dropna()
+    clean = drop_incomplete(df[[y_col, x_col]])
     y = clean[y_col].astype(float).values
     x = clean[x_col].astype(float).values
     n = len(y)
@@ -173,45 +198,66 @@ def simple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": "Need at least 3 observations"})
 
     try:
-        import statsmodels.api as sm
-
-        X = sm.add_constant(x)
-        model = sm.OLS(y, X).fit()
-
-        fitted = model.fittedvalues
-        residuals = model.resid
+        # Closed-form least squares for one predictor: the same estimates,
+        # standard errors and information criteria statsmodels OLS reports
+        x_mean = x.mean()
+        y_mean = y.mean()
+        dx = x - x_mean
+        dy = y - y_mean
+        sxx = float(dx @ dx)
+        if sxx == 0:
+            raise ValueError(f"X column '{x_col}' is constant")
+        slope = float(dx @ dy) / sxx
+        intercept = float(y_mean - slope * x_mean)
+
+        fitted = intercept + slope * x
+        residuals = y - fitted
+        sse = float(residuals @ residuals)
+        sst = float(dy @ dy)
+        df_resid = n - 2
+        mse = sse / df_resid
+
+        params = np.array([intercept, slope])
+        bse = np.sqrt([mse * (1.0 / n + x_mean * x_mean / sxx), mse / sxx])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tvalues = params / bse
+        pvalues = 2 * sp_stats.t.sf(np.abs(tvalues), df_resid)
+        t_crit = float(sp_stats.t.ppf(1 - alpha / 2, df_resid))
+
+        r_squared = 1 - sse / sst
+        f_statistic = float(tvalues[1] ** 2)
+        llf = -n / 2 * (np.log(2 * np.pi) + np.log(sse / n) + 1)
 
         summary_dict = {
-            "r_squared": float(model.rsquared),
-            "adj_r_squared": float(model.rsquared_adj),
-            "f_statistic": float(model.fvalue),
-            "f_p_value": float(model.f_pvalue),
-            "significant": float(model.f_pvalue) < alpha,
-            "intercept": float(model.params[0]),
-            "slope": float(model.params[1]),
-            "slope_p_value": float(model.pvalues[1]),
-            "slope_ci_lower": float(model.conf_int(alpha)[1][0]),
-            "slope_ci_upper": float(model.conf_int(alpha)[1][1]),
+            "r_squared": float(r_squared),
+            "adj_r_squared": float(1 - (n - 1) / df_resid * (1 - r_squared)),
+            "f_statistic": f_statistic,
+            "f_p_value": float(pvalues[1]),
+            "significant": float(pvalues[1]) < alpha,
+            "intercept": intercept,
+            "slope": slope,
+            "slope_p_value": float(pvalues[1]),
+            "slope_ci_lower": float(slope - t_crit * bse[1]),
+            "slope_ci_upper": float(slope + t_crit * bse[1]),
             "n": n,
-            "durbin_watson": float(sm.stats.stattools.durbin_watson(residuals)),
+            "durbin_watson": _durbin_watson(residuals),
         }
 
-        # Trendline for scatter plot
-        x_sorted = np.sort(x)
-        y_trend = model.params[0] + model.params[1] * x_sorted
+        chart_list: list[PlotlyChart] = []
+        if include_charts:
+            # Trendline for scatter plot — the fitted values in x order
+            order = np.argsort(x)
 
-        chart_list = [
-            charts.scatter(
+            chart_list.append(charts.scatter(
                 x=x.tolist(), y=y.tolist(),
                 title=f"{y_col} vs {x_col}",
                 xaxis_title=x_col, yaxis_title=y_col,
-                trendline={"x": x_sorted.tolist(), "y": y_trend.tolist(), "name": "Regression Line"},
-            ),
-        ]
-        chart_list.extend(charts.residual_plots(
-            fitted=fitted.tolist(), residuals=residuals.tolist(),
-            title=f"{y_col} ~ {x_col}",
-        ))
+                trendline={"x": x[order].tolist(), "y": fitted[order].tolist(), "name": "Regression Line"},
+            ))
+            chart_list.extend(charts.residual_plots(
+                fitted=fitted.tolist(), residuals=residuals.tolist(),
+                title=f"{y_col} ~ {x_col}",
+            ))
 
         # Equation
         equation = f"{y_col} = {summary_dict['intercept']:.4f} + {summary_dict['slope']:.4f} × {x_col}"
@@ -225,28 +271,28 @@ def simple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
                 "y_column": y_col, "x_column": x_col, "alpha": alpha,
                 "equation": equation,
                 "coefficients": {
-                    "const": {"value": float(model.params[0]), "std_err": float(model.bse[0]),
-                              "t_stat": float(model.tvalues[0]), "p_value": float(model.pvalues[0])},
-                    x_col: {"value": float(model.params[1]), "std_err": float(model.bse[1]),
-                             "t_stat": float(model.tvalues[1]), "p_value": float(model.pvalues[1])},
+                    "const": {"value": intercept, "std_err": float(bse[0]),
+                              "t_stat": float(tvalues[0]), "p_value": float(pvalues[0])},
+                    x_col: {"value": slope, "std_err": float(bse[1]),
+                             "t_stat": float(tvalues[1]), "p_value": float(pvalues[1])},
                 },
-                "aic": float(model.aic),
-                "bic": float(model.bic),
+                "aic": float(-2 * llf + 4),
+                "bic": float(-2 * llf + 2 * np.log(n)),
             },
             charts=chart_list,
             interpretation_context={
                 "test_name": "Simple Linear Regression",
                 "equation": equation,
-                "r_squared": float(model.rsquared),
-                "r_squared_pct": round(float(model.rsquared) * 100, 1),
-                "slope": float(model.params[1]),
-                "slope_p_value": float(model.pvalues[1]),
-                "significant": float(model.f_pvalue) < alpha,
+                "r_squared": summary_dict["r_squared"],
+                "r_squared_pct": round(summary_dict["r_squared"] * 100, 1),
+                "slope": slope,
+                "slope_p_value": summary_dict["slope_p_value"],
+                "significant": summary_dict["significant"],
                 "alpha": alpha,
                 "y_column": y_col, "x_column": x_col,
                 "interpretation": (
-                    f"For every 1-unit increase in {x_col}, {y_col} changes by {model.params[1]:.4f} units. "
-                    f"The model explains {model.rsquared * 100:.1f}% of the variation in {y_col}."
+                    f"For every 1-unit increase in {x_col}, {y_col} changes by {slope:.4f} units. "
+                    f"The model explains {summary_dict['r_squared'] * 100:.1f}% of the variation in {y_col}."
                 ),
             },
             warnings=warnings,
@@ -257,20 +303,165 @@ def simple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": str(e)}, warnings=[str(e)])
 
 
+# ---------------------------------------------------------------------------
+# Simple Linear Regression — batch over predictors
+# ---------------------------------------------------------------------------
+
+def simple_regression_batch(df: pd.DataFrame, config: dict) -> AnalysisResult:
+    """
+    Fit y ~ x separately for each of several predictors in one vectorized
+    pass (shared centering of y, column-wise sums over the predictor block).
+    Uses rows complete across y and every predictor.
+
+    Config:
+        y_column: str        — response variable
+        x_columns: list[str] — predictors, each fitted on its own
+        alpha: float         — significance level (default: 0.05)
+    """
+    y_col = config.get("y_column")
+    x_cols = config.get("x_columns", [])
+    alpha = config.get("alpha", 0.05)
+
+    if not y_col or y_col not in df.columns:
+        return AnalysisResult(test_type="simple_regression_batch", test_category="regression", success=False,
+                              summary={}, details={"error": f"Y column '{y_col}' not found"})
+
+    missing = [c for c in x_cols if c not in df.columns]
+    if missing:
+        return AnalysisResult(test_type="simple_regression_batch", test_category="regression", success=False,
+                              summary={}, details={"error": f"X columns not found: {missing}"})
+
+    if len(x_cols) < 1:
+        return AnalysisResult(test_type="simple_regression_batch", test_category="regression", success=False,
+                              summary={}, details={"error": "Need at least 1 predictor column"})
+
+    clean = drop_incomplete(df[[y_col] + x_cols])
+    n = len(clean)
+    warnings: list[str] = []
+
+    if n < 3:
+        return AnalysisResult(test_type="simple_regression_batch", test_category="regression", success=False,
+                              summary={}, details={"error": "Need at least 3 observations"})
+
+    try:
+        y = clean[y_col].to_numpy(dtype=np.float64)
+        X = clean[x_cols].to_numpy(dtype=np.float64)
+
+        dy = y - y.mean()
+        dX = X - X.mean(axis=0)
+        sxx = np.einsum("ij,ij->j", dX, dX)
+
+        constant = sxx == 0
+        for col in np.asarray(x_cols, dtype=object)[constant]:
+            warnings.append(f"X column '{col}' is constant and was skipped")
+        fit_cols = [c for c, skip in zip(x_cols, constant.tolist()) if not skip]
+        if not fit_cols:
+            raise ValueError("All X columns are constant")
+        dX, sxx, x_means = dX[:, ~constant], sxx[~constant], X[:, ~constant].mean(axis=0)
+
+        slopes = (dy @ dX) / sxx
+        intercepts = y.mean() - slopes * x_means
+        residuals = dy[:, None] - dX * slopes
+        sse = np.einsum("ij,ij->j", residuals, residuals)
+        sst = float(dy @ dy)
+        df_resid = n - 2
+
+        se_slopes = np.sqrt(sse / df_resid / sxx)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_stats = slopes / se_slopes
+        p_values = 2 * sp_stats.t.sf(np.abs(t_stats), df_resid)
+        t_crit = float(sp_stats.t.ppf(1 - alpha / 2, df_resid))
+        r_squared = 1 - sse / sst
+
+        fits = {
+            col: {
+                "intercept": b0, "slope": b1, "slope_std_err": se, "t_stat": t, "slope_p_value": p,
+                "slope_ci_lower": b1 - t_crit * se, "slope_ci_upper": b1 + t_crit * se,
+                "r_squared": r2, "significant": p < alpha,
+            }
+            for col, b0, b1, se, t, p, r2 in zip(
+                fit_cols, intercepts.tolist(), slopes.tolist(), se_slopes.tolist(),
+                t_stats.tolist(), p_values.tolist(), r_squared.tolist(),
+            )
+        }
+
+        order = np.argsort(-r_squared, kind="stable")
+        ranked = [fit_cols[i] for i in order.tolist()]
+        significant_predictors = [col for col in ranked if fits[col]["significant"]]
+
+        summary_dict = {
+            "n": n,
+            "predictor_count": len(fit_cols),
+            "best_predictor": ranked[0],
+            "best_r_squared": fits[ranked[0]]["r_squared"],
+            "significant_predictors": significant_predictors,
+        }
+
+        chart_list = [
+            charts.bar_chart(
+                categories=ranked,
+                values=r_squared[order].tolist(),
+                title=f"R² of Single-Predictor Fits — {y_col}",
+                yaxis_title="R²",
+                orientation="h",
+            ),
+        ]
+
+        return AnalysisResult(
+            test_type="simple_regression_batch",
+            test_category="regression",
+            success=True,
+            summary=summary_dict,
+            details={"y_column": y_col, "x_columns": fit_cols, "alpha": alpha, "fits": fits},
+            charts=chart_list,
+            interpretation_context={
+                "test_name": "Simple Linear Regression (per predictor)",
+                "y_column": y_col,
+                "ranked_predictors": ranked,
+                "r_squared": {col: fits[col]["r_squared"] for col in ranked},
+                "significant_predictors": significant_predictors,
+                "alpha": alpha,
+            },
+            warnings=warnings,
+        )
+
+    except Exception as e:
+        return AnalysisResult(test_type="simple_regression_batch", test_category="regression", success=False,
+                              summary={}, details={"error": str(e)}, warnings=[str(e)])
+
+
 # ---------------------------------------------------------------------------
 # Multiple Linear Regression
 # ---------------------------------------------------------------------------
 
+def _vif(x_pred: np.ndarray, X: np.ndarray) -> np.ndarray:
+    """
+    Variance inflation factors for every predictor column at once: with an
+    intercept in the model, VIF_i = 1 / (1 - R^2_i) is the i-th diagonal
+    entry of the inverse predictor correlation matrix. Falls back to one
+    auxiliary regression per predictor (on X, which carries the constant in
+    column 0) when that matrix is singular.
+    """
+    if x_pred.shape[1] == 1:
+        return np.ones(1)
+    try:
+        return np.diag(np.linalg.inv(np.corrcoef(x_pred, rowvar=False))).copy()
+    except np.linalg.LinAlgError:
+        return np.array([variance_inflation_factor(X, i + 1) for i in range(x_pred.shape[1])])
+
+
 def multiple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
     """
     Config:
         y_column: str        — response variable
         x_columns: list[str] — predictor variables
         alpha: float         — significance level (default: 0.05)
+        include_charts: bool — build residual charts (default: True)
     """
     y_col = config.get("y_column")
     x_cols = config.get("x_columns", [])
     alpha = config.get("alpha", 0.05)
+    include_charts = config.get("include_charts", True)
 
     if not y_col or y_col not in df.columns:
         return AnalysisResult(test_type="multiple_regression", test_category="regression", success=False,
@@ -285,7 +476,7 @@ def multiple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="multiple_regression", test_category="regression", success=False,
                               summary={}, details={"error": "Need at least 1 predictor column"})
 
-    clean = df[[y_col] + x_cols].dropna()
+    clean = drop_incomplete(df[[y_col] + x_cols])
     n = len(clean)
     warnings: list[str] = []
 
@@ -300,37 +491,37 @@ def multiple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
         )
 
     try:
-        import statsmodels.api as sm
-
         y = clean[y_col].astype(float).values
-        X = sm.add_constant(clean[x_cols].astype(float).values)
+        x_pred = clean[x_cols].astype(float).values
+        X = sm.add_constant(x_pred)
         model = sm.OLS(y, X).fit()
 
         fitted = model.fittedvalues
         residuals = model.resid
 
         # VIF for multicollinearity
-        from statsmodels.stats.outliers_influence import variance_inflation_factor
         vif_data = {}
-        for i, col in enumerate(x_cols):
-            vif = variance_inflation_factor(X, i + 1)  # +1 because index 0 is constant
-            vif_data[col] = float(vif)
+        for col, vif in zip(x_cols, _vif(x_pred, X).tolist()):
+            vif_data[col] = vif
             if vif > 10:
                 warnings.append(f"High multicollinearity detected for '{col}' (VIF = {vif:.1f})")
 
         # Build coefficients
         coeff_names = ["const"] + x_cols
+        ci = np.asarray(model.conf_int(alpha))
         coefficients = {}
-        for i, name in enumerate(coeff_names):
-            ci = model.conf_int(alpha)
+        for name, value, se, t, p, (lo, hi) in zip(
+            coeff_names, np.asarray(model.params).tolist(), np.asarray(model.bse).tolist(),
+            np.asarray(model.tvalues).tolist(), np.asarray(model.pvalues).tolist(), ci.tolist(),
+        ):
             coefficients[name] = {
-                "value": float(model.params[i]),
-                "std_err": float(model.bse[i]),
-                "t_stat": float(model.tvalues[i]),
-                "p_value": float(model.pvalues[i]),
-                "ci_lower": float(ci[i][0]),
-                "ci_upper": float(ci[i][1]),
-                "significant": float(model.pvalues[i]) < alpha,
+                "value": value,
+                "std_err": se,
+                "t_stat": t,
+                "p_value": p,
+                "ci_lower": lo,
+                "ci_upper": hi,
+                "significant": p < alpha,
             }
 
         significant_predictors = [name for name, c in coefficients.items()
@@ -350,7 +541,7 @@ def multiple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
         chart_list = charts.residual_plots(
             fitted=fitted.tolist(), residuals=residuals.tolist(),
             title=f"Multiple Regression: {y_col}",
-        )
+        ) if include_charts else []
 
         return AnalysisResult(
             test_type="multiple_regression",
@@ -363,7 +554,7 @@ def multiple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
                 "vif": vif_data,
                 "aic": float(model.aic),
                 "bic": float(model.bic),
-                "durbin_watson": float(sm.stats.stattools.durbin_watson(residuals)),
+                "durbin_watson": _durbin_watson(np.asarray(residuals)),
             },
             charts=chart_list,
             interpretation_context={
@@ -389,12 +580,74 @@ def multiple_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
 # Logistic Regression
 # ---------------------------------------------------------------------------
 
+_LOGIT_MAX_ITER = 35
+_LOGIT_TOL = 1e-8
+
+
+def _logit_newton(X: np.ndarray, y: np.ndarray) -> dict | None:
+    """
+    Maximum-likelihood logit fit by Newton-Raphson, the same iteration
+    statsmodels Logit.fit() runs by default, without building a results
+    object. Returns None when it does not converge to a finite optimum
+    (e.g. separation) or the Hessian is singular, so the caller can defer
+    to statsmodels.
+    """
+    n, k = X.shape
+    params = np.zeros(k)
+    for _ in range(_LOGIT_MAX_ITER):
+        prob = sp_special.expit(X @ params)
+        hessian = (X * (prob * (1 - prob))[:, None]).T @ X
+        try:
+            step = np.linalg.solve(hessian, X.T @ (y - prob))
+        except np.linalg.LinAlgError:
+            return None
+        params = params + step
+        if np.max(np.abs(step)) <= _LOGIT_TOL:
+            break
+    else:
+        return None
+
+    eta = X @ params
+    prob = sp_special.expit(eta)
+    hessian = (X * (prob * (1 - prob))[:, None]).T @ X
+    try:
+        bse = np.sqrt(np.diag(np.linalg.inv(hessian)))
+    except np.linalg.LinAlgError:
+        return None
+    if not (np.all(np.isfinite(params)) and np.all(np.isfinite(bse))):
+        return None
+
+    llf = float(np.sum(y * eta - np.logaddexp(0, eta)))
+    y_bar = y.mean()
+    llnull = float(n * (y_bar * np.log(y_bar) + (1 - y_bar) * np.log(1 - y_bar)))
+    return {
+        "params": params, "bse": bse, "predicted": prob, "llf": llf,
+        "prsquared": 1 - llf / llnull,
+        "aic": -2 * llf + 2 * k,
+        "bic": float(-2 * llf + np.log(n) * k),
+    }
+
+
+def _logit_statsmodels(X: np.ndarray, y: np.ndarray) -> dict:
+    """The same quantities as _logit_newton, from a statsmodels Logit fit."""
+    model = sm.Logit(y, X).fit(disp=0)
+    return {
+        "params": np.asarray(model.params), "bse": np.asarray(model.bse),
+        "predicted": np.asarray(model.predict(X)), "llf": float(model.llf),
+        "prsquared": float(model.prsquared),
+        "aic": float(model.aic),
+        "bic": float(model.bic),
+    }
+
+
 def logistic_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
     """
     Config:
         y_column: str        — binary response variable (0/1 or categorical with 2 levels)
         x_columns: list[str] — predictor variables
         alpha: float         — significance level (default: 0.05)
+        fast_path: bool      — fit by direct Newton iterations (default: True);
+                               False always uses statsmodels Logit
     """
     y_col = config.get("y_column")
     x_cols = config.get("x_columns", [])
@@ -409,7 +662,7 @@ def logistic_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="logistic_regression", test_category="regression", success=False,
                               summary={}, details={"error": f"X columns not found: {missing}"})
 
-    clean = df[[y_col] + x_cols].dropna()
+    clean = drop_incomplete(df[[y_col] + x_cols])
     warnings: list[str] = []
 
     # Encode binary Y
@@ -419,8 +672,14 @@ def logistic_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"Y must have exactly 2 levels, found {len(y_values)}: {list(y_values)}"},
                               warnings=["Logistic regression requires a binary outcome variable"])
 
-    # Map to 0/1
-    if set(y_values) == {0, 1} or set(y_values) == {0.0, 1.0}:
+    # Map to 0/1 — levels in sorted order so the coding does not depend on
+    # which level happens to appear first (mixed, unorderable types keep
+    # appearance order)
+    try:
+        y_values = sorted(y_values)
+    except TypeError:
+        y_values = list(y_values)
+    if pd.api.types.is_numeric_dtype(clean[y_col]) and y_values == [0, 1]:
         y = clean[y_col].astype(float).values
     else:
         mapping = {y_values[0]: 0, y_values[1]: 1}
@@ -432,45 +691,57 @@ def logistic_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
         warnings.append(f"Small sample ({n}) for {len(x_cols)} predictors. Results may be unreliable.")
 
     try:
-        import statsmodels.api as sm
-
         X = sm.add_constant(clean[x_cols].astype(float).values)
-        model = sm.Logit(y, X).fit(disp=0)
+        fit = _logit_newton(X, y) if config.get("fast_path", True) else None
+        if fit is None:
+            fit = _logit_statsmodels(X, y)
 
+        # Coefficient statistics as whole arrays — Wald z tests and normal
+        # CIs as in statsmodels, odds ratios in one exp call — converted to
+        # Python floats once
         coeff_names = ["const"] + x_cols
+        params, bse = fit["params"], fit["bse"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_stats = params / bse
+        p_values = 2 * sp_stats.norm.sf(np.abs(z_stats))
+        z_crit = sp_stats.norm.ppf(1 - alpha / 2)
         coefficients = {}
-        for i, name in enumerate(coeff_names):
-            ci = model.conf_int(alpha)
+        for name, value, odds_ratio, se, z, p, lo, hi in zip(
+            coeff_names, params.tolist(), np.exp(params).tolist(), bse.tolist(), z_stats.tolist(),
+            p_values.tolist(), (params - z_crit * bse).tolist(), (params + z_crit * bse).tolist(),
+        ):
             coefficients[name] = {
-                "value": float(model.params[i]),
-                "odds_ratio": float(np.exp(model.params[i])),
-                "std_err": float(model.bse[i]),
-                "z_stat": float(model.tvalues[i]),
-                "p_value": float(model.pvalues[i]),
-                "ci_lower": float(ci[i][0]),
-                "ci_upper": float(ci[i][1]),
-                "significant": float(model.pvalues[i]) < alpha,
+                "value": value,
+                "odds_ratio": odds_ratio,
+                "std_err": se,
+                "z_stat": z,
+                "p_value": p,
+                "ci_lower": lo,
+                "ci_upper": hi,
+                "significant": p < alpha,
             }
 
         # Classification metrics
-        predicted_probs = model.predict(X)
-        predicted_class = (predicted_probs >= 0.5).astype(int)
-        accuracy = float(np.mean(predicted_class == y))
+        predicted_probs = fit["predicted"]
+        predicted_class = (predicted_probs >= 0.5).astype(np.intp)
+        # One pass over packed (actual, predicted) codes: [TN, FP, FN, TP]
+        tn, fp, fn, tp = np.bincount(2 * y.astype(np.intp) + predicted_class, minlength=4).tolist()
+        accuracy = (tn + tp) / n
         confusion = {
-            "true_positive": int(((predicted_class == 1) & (y == 1)).sum()),
-            "true_negative": int(((predicted_class == 0) & (y == 0)).sum()),
-            "false_positive": int(((predicted_class == 1) & (y == 0)).sum()),
-            "false_negative": int(((predicted_class == 0) & (y == 1)).sum()),
+            "true_positive": tp,
+            "true_negative": tn,
+            "false_positive": fp,
+            "false_negative": fn,
         }
 
         significant_predictors = [name for name, c in coefficients.items()
                                   if name != "const" and c["significant"]]
 
         summary_dict = {
-            "pseudo_r_squared": float(model.prsquared),
-            "log_likelihood": float(model.llf),
-            "aic": float(model.aic),
-            "bic": float(model.bic),
+            "pseudo_r_squared": fit["prsquared"],
+            "log_likelihood": fit["llf"],
+            "aic": fit["aic"],
+            "bic": fit["bic"],
             "accuracy": accuracy,
             "n": n,
             "significant_predictors": significant_predictors,
@@ -491,7 +762,7 @@ def logistic_regression(df: pd.DataFrame, config: dict) -> AnalysisResult:
             interpretation_context={
                 "test_name": "Logistic Regression",
                 "y_column": y_col,
-                "pseudo_r_squared": float(model.prsquared),
+                "pseudo_r_squared": fit["prsquared"],
                 "accuracy": accuracy,
                 "accuracy_pct": round(accuracy * 100, 1),
                 "significant_predictors": significant_predictors,
@@ -3,6 +3,7 @@ Statistical Process Control (SPC) — control charts for monitoring process stab
 
 Charts:
   - i_mr_chart: Individual measurements and Moving Range
+  - i_mr_chart_batch: I-MR limits for several measurement columns at once
   - xbar_r_chart: Subgroup means (X-bar) and Ranges (R)
   - p_chart: Proportion defective
   - np_chart: Count defective (constant sample size)
@@ -12,7 +13,7 @@ Charts:
 
 from __future__ import annotations
 
-from typing import Sequence
+import math
 
 import numpy as np
 
@@ -20,16 +21,110 @@ from app.stats import AnalysisResult, PlotlyChart
 from app.stats import charts as chart_module
 
 
-def _detect_violations(values: Sequence[float], cl: float, ucl: float, lcl: float) -> list[int]:
+def _float_values(data: "pd.Series | pd.DataFrame") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Non-missing rows of a column (or of a block of columns) as float64, in
+    one conversion plus one boolean compaction. Returns (values, keep) where
+    keep marks the retained rows of the input.
+    """
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(values)
+    keep = ~(missing.any(axis=1) if values.ndim == 2 else missing)
+    return values[keep], keep
+
+
+def _scalar_sqrt(x: float) -> float:
+    """math.sqrt for the scalar limit paths; NaN for negative input, as np.sqrt gives."""
+    return math.sqrt(x) if x >= 0 else math.nan
+
+
+def _detect_violations(
+    values: np.ndarray, cl: float, ucl: float | np.ndarray, lcl: float | np.ndarray,
+) -> list[int]:
     """
     Detect Western Electric / Nelson rules violations.
     Returns indices of out-of-control points (Rule 1: beyond 3-sigma).
+    Limits may be scalars or per-point arrays (variable-limit charts).
+    """
+    values = np.asarray(values)
+    return np.flatnonzero((values > ucl) | (values < lcl)).tolist()
+
+
+def _subgroup_stats(subgroups: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    violations = []
-    for i, v in enumerate(values):
-        if v > ucl or v < lcl:
-            violations.append(i)
-    return violations
+    Subgroup means and ranges in one sweep over the (k, n) matrix: the
+    running sum, min and max are updated column by column, so the narrow
+    rows are not reduced twice.
+    """
+    if subgroups.shape[1] == 2:
+        a, b = subgroups[:, 0], subgroups[:, 1]
+        return (a + b) * 0.5, np.abs(a - b)
+    first = subgroups[:, 0]
+    total, lo, hi = first.copy(), first.copy(), first.copy()
+    for j in range(1, subgroups.shape[1]):
+        col = subgroups[:, j]
+        total += col
+        np.minimum(lo, col, out=lo)
+        np.maximum(hi, col, out=hi)
+    total /= subgroups.shape[1]
+    hi -= lo
+    return total, hi
+
+
+def _window_ends(mask: np.ndarray, width: int, at_least: int | None = None) -> np.ndarray:
+    """
+    Indices i (relative to mask) ending a window mask[i-width+1 : i+1] with at
+    least `at_least` (default: all) True entries, from one cumulative sum.
+    """
+    if len(mask) < width:
+        return np.empty(0, dtype=np.intp)
+    csum = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+    counts = csum[width:] - csum[:-width]
+    return np.flatnonzero(counts >= (width if at_least is None else at_least)) + (width - 1)
+
+
+def _nelson_rules(values: np.ndarray, cl: float, sigma: float) -> dict[str, list[int]]:
+    """
+    Nelson rules 2-8 (rule 1 is _detect_violations). Each entry lists the
+    indices of the points that complete a signalling pattern. Empty when
+    sigma is zero, since zone tests are undefined.
+    """
+    if not sigma > 0:
+        return {}
+    z = (values - cl) / sigma
+    above, below = z > 0, z < 0
+    step = np.diff(values)
+    rising, falling = step > 0, step < 0
+    alternating = step[:-1] * step[1:] < 0
+
+    rules = {
+        # 9 points in a row on the same side of the center line
+        "rule_2": np.union1d(_window_ends(above, 9), _window_ends(below, 9)),
+        # 6 points in a row steadily increasing or decreasing
+        "rule_3": np.union1d(_window_ends(rising, 5), _window_ends(falling, 5)) + 1,
+        # 14 points in a row alternating up and down
+        "rule_4": _window_ends(alternating, 12) + 2,
+        # 2 of 3 points beyond 2 sigma on the same side
+        "rule_5": np.union1d(_window_ends(z > 2, 3, 2), _window_ends(z < -2, 3, 2)),
+        # 4 of 5 points beyond 1 sigma on the same side
+        "rule_6": np.union1d(_window_ends(z > 1, 5, 4), _window_ends(z < -1, 5, 4)),
+        # 15 points in a row within 1 sigma
+        "rule_7": _window_ends(np.abs(z) < 1, 15),
+        # 8 points in a row beyond 1 sigma, on both sides of the center line
+        "rule_8": np.setdiff1d(
+            _window_ends(np.abs(z) > 1, 8),
+            np.union1d(_window_ends(z > 1, 8), _window_ends(z < -1, 8)),
+        ),
+    }
+    return {rule: idx.tolist() for rule, idx in rules.items()}
+
+
+def _nelson_warning(rules: dict[str, list[int]], chart_name: str) -> str | None:
+    """One warning line summarising the Nelson rules 2-8 that signalled."""
+    fired = [f"{rule.replace('_', ' ')} ({len(idx)})" for rule, idx in rules.items() if idx]
+    if not fired:
+        return None
+    return f"Nelson rule signals on {chart_name}: " + ", ".join(fired)
 
 
 # ---------------------------------------------------------------------------
@@ -41,18 +136,19 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     Config:
         column: str          — measurement column
         labels_column: str   — optional column for point labels (e.g., date or sample ID)
+        include_series: bool — return the per-point series in details (default: True)
+        include_charts: bool — build the control chart figures (default: True)
     """
-    import pandas as pd
-
     column = config.get("column")
     labels_col = config.get("labels_column")
+    include_series = config.get("include_series", True)
+    include_charts = config.get("include_charts", True)
 
     if not column or column not in df.columns:
         return AnalysisResult(test_type="i_mr_chart", test_category="spc", success=False,
                               summary={}, details={"error": f"Column '{column}' not found"})
 
-    series = df[column].dropna().astype(float)
-    values = series.values
+    values, keep = _float_values(df[column])
     n = len(values)
 
     if n < 2:
@@ -60,11 +156,12 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
                               summary={}, details={"error": "Need at least 2 observations"})
 
     labels = None
-    if labels_col and labels_col in df.columns:
-        labels = df.loc[series.index, labels_col].astype(str).tolist()
+    if include_charts and labels_col and labels_col in df.columns:
+        labels = df[labels_col][keep].astype(str).tolist()
 
-    # Moving ranges
-    mr = np.abs(np.diff(values))
+    # Moving ranges, made absolute in the diff's own buffer
+    mr = np.diff(values)
+    np.abs(mr, out=mr)
     mr_mean = float(np.mean(mr))
 
     # Constants for n=2 (individual chart)
@@ -72,8 +169,13 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     d3 = 0.853
     d4 = 3.267
 
+    # A zero average moving range means every point equals the first. Use that
+    # value as the centre line: the float mean can round off it, and with
+    # collapsed limits every point would then be flagged.
+    constant = mr_mean == 0
+
     # I-chart limits
-    x_bar = float(np.mean(values))
+    x_bar = float(values[0]) if constant else float(np.mean(values))
     sigma_est = mr_mean / d2
     i_ucl = x_bar + 3 * sigma_est
     i_lcl = x_bar - 3 * sigma_est
@@ -82,19 +184,34 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     mr_ucl = d4 * mr_mean
     mr_lcl = 0.0  # MR chart LCL is always 0
 
-    # Detect violations
-    i_violations = _detect_violations(values.tolist(), x_bar, i_ucl, i_lcl)
-    mr_violations = _detect_violations(mr.tolist(), mr_mean, mr_ucl, mr_lcl)
+    # Detect violations (none possible for a constant series)
+    if constant:
+        i_violations, mr_violations, i_rules = [], [], {}
+    else:
+        i_violations = _detect_violations(values, x_bar, i_ucl, i_lcl)
+        mr_violations = _detect_violations(mr, mr_mean, mr_ucl, mr_lcl)
+        i_rules = _nelson_rules(values, x_bar, sigma_est)
 
     warnings: list[str] = []
+    if constant:
+        warnings.append(
+            f"All {n} values of '{column}' are identical; control limits collapse to the "
+            "center line (check for a stuck sensor or a placeholder value)"
+        )
     if i_violations:
         warnings.append(f"{len(i_violations)} point(s) out of control on Individuals chart")
     if mr_violations:
         warnings.append(f"{len(mr_violations)} point(s) out of control on Moving Range chart")
+    if rule_warning := _nelson_warning(i_rules, "Individuals chart"):
+        warnings.append(rule_warning)
+
+    # Boxed once, shared by the charts and details when either wants them
+    values_list = values.tolist() if include_charts or include_series else None
+    mr_list = mr.tolist() if include_charts or include_series else None
 
     chart_list = [
         chart_module.control_chart(
-            values=values.tolist(),
+            values=values_list,
             center_line=x_bar,
             ucl=i_ucl,
             lcl=i_lcl,
@@ -104,7 +221,7 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
             violations=i_violations,
         ),
         chart_module.control_chart(
-            values=mr.tolist(),
+            values=mr_list,
             center_line=mr_mean,
             ucl=mr_ucl,
             lcl=mr_lcl,
@@ -113,7 +230,17 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
             point_labels=labels[1:] if labels else None,
             violations=mr_violations,
         ),
-    ]
+    ] if include_charts else []
+
+    details = {
+        "column": column,
+        "i_violation_indices": i_violations,
+        "mr_violation_indices": mr_violations,
+        "i_nelson_rule_indices": i_rules,
+    }
+    if include_series:
+        details["values"] = values_list
+        details["moving_ranges"] = mr_list
 
     summary = {
         "x_bar": x_bar,
@@ -133,12 +260,7 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         test_category="spc",
         success=True,
         summary=summary,
-        details={
-            "column": column, "values": values.tolist(),
-            "moving_ranges": mr.tolist(),
-            "i_violation_indices": i_violations,
-            "mr_violation_indices": mr_violations,
-        },
+        details=details,
         charts=chart_list,
         interpretation_context={
             "test_name": "I-MR Control Chart",
@@ -158,6 +280,114 @@ def i_mr_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     )
 
 
+def i_mr_chart_batch(df: "pd.DataFrame", config: dict) -> AnalysisResult:
+    """
+    I-MR limits and out-of-control points for several measurement columns in
+    one pass over the column block. Each column drops its own missing values,
+    as i_mr_chart does, so per-column results match a separate i_mr_chart call.
+
+    Config:
+        columns: list[str]   — measurement columns, each charted on its own
+        include_charts: bool — build the violations overview chart (default: True)
+    """
+    columns = config.get("columns", [])
+    include_charts = config.get("include_charts", True)
+
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        return AnalysisResult(test_type="i_mr_chart_batch", test_category="spc", success=False,
+                              summary={}, details={"error": f"Columns not found: {missing}"})
+    if not columns:
+        return AnalysisResult(test_type="i_mr_chart_batch", test_category="spc", success=False,
+                              summary={}, details={"error": "Need at least 1 measurement column"})
+
+    mat = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    absent = np.isnan(mat)
+    counts = len(mat) - absent.sum(axis=0)
+
+    warnings: list[str] = []
+    short = counts < 2
+    for col in np.asarray(columns, dtype=object)[short]:
+        warnings.append(f"Column '{col}' has fewer than 2 observations and was skipped")
+    chart_cols = [c for c, skip in zip(columns, short.tolist()) if not skip]
+    if not chart_cols:
+        return AnalysisResult(test_type="i_mr_chart_batch", test_category="spc", success=False,
+                              summary={}, details={"error": "Need at least 2 observations"},
+                              warnings=warnings)
+
+    # Move each column's missing values to the bottom, keeping the order of the
+    # rest, so one diff down the block gives every column's moving ranges
+    order = np.argsort(absent[:, ~short], axis=0, kind="stable")
+    mat = np.take_along_axis(mat[:, ~short], order, axis=0)
+    counts = counts[~short]
+    mr = np.diff(mat, axis=0)
+    np.abs(mr, out=mr)
+
+    constants = _XBAR_R_CONSTANTS[2]  # moving ranges are subgroups of size 2
+    x_bar = np.nanmean(mat, axis=0)
+    mr_bar = np.nanmean(mr, axis=0)
+    # Constant columns: centre on the exact value, as i_mr_chart does
+    constant = mr_bar == 0
+    x_bar[constant] = mat[0, constant]
+    sigma_est = mr_bar / constants["d2"]
+    i_ucl = x_bar + 3 * sigma_est
+    i_lcl = x_bar - 3 * sigma_est
+    mr_ucl = constants["D4"] * mr_bar
+
+    # NaN padding compares False, so it never counts as a violation
+    i_out = (mat > i_ucl) | (mat < i_lcl)
+    mr_out = mr > mr_ucl
+    i_counts = i_out.sum(axis=0)
+    mr_counts = mr_out.sum(axis=0)
+
+    results = {
+        col: {
+            "x_bar": xb, "mr_bar": mrb, "sigma_estimate": sig,
+            "i_ucl": iu, "i_lcl": il, "mr_ucl": mu, "n": n,
+            "i_violations": iv, "mr_violations": mv, "in_control": iv == 0 and mv == 0,
+            "i_violation_indices": np.flatnonzero(i_out[:, j]).tolist(),
+            "mr_violation_indices": np.flatnonzero(mr_out[:, j]).tolist(),
+        }
+        for j, (col, xb, mrb, sig, iu, il, mu, n, iv, mv) in enumerate(zip(
+            chart_cols, x_bar.tolist(), mr_bar.tolist(), sigma_est.tolist(),
+            i_ucl.tolist(), i_lcl.tolist(), mr_ucl.tolist(), counts.tolist(),
+            i_counts.tolist(), mr_counts.tolist(),
+        ))
+    }
+    out_of_control = [col for col in chart_cols if not results[col]["in_control"]]
+    if out_of_control:
+        warnings.append(f"{len(out_of_control)} column(s) out of control: {', '.join(out_of_control)}")
+
+    chart_list = [
+        chart_module.bar_chart(
+            categories=chart_cols,
+            values=(i_counts + mr_counts).tolist(),
+            title="Out-of-Control Points by Column (I + MR)",
+            yaxis_title="Points",
+        ),
+    ] if include_charts else []
+
+    return AnalysisResult(
+        test_type="i_mr_chart_batch",
+        test_category="spc",
+        success=True,
+        summary={
+            "num_columns": len(chart_cols),
+            "columns_out_of_control": out_of_control,
+            "in_control": not out_of_control,
+        },
+        details={"columns": results},
+        charts=chart_list,
+        interpretation_context={
+            "test_name": "I-MR Control Charts (per column)",
+            "columns": chart_cols,
+            "columns_out_of_control": out_of_control,
+            "total_violations": int(i_counts.sum() + mr_counts.sum()),
+        },
+        warnings=warnings,
+    )
+
+
 # ---------------------------------------------------------------------------
 # X-bar/R Chart (Subgroup Means and Ranges)
 # ---------------------------------------------------------------------------
@@ -184,13 +414,15 @@ def xbar_r_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         column: str            — single column with measurements
         subgroup_size: int     — subgroup size (if single column, groups sequentially)
         labels_column: str     — optional point labels
+        include_series: bool   — return the per-subgroup series in details (default: True)
+        include_charts: bool   — build the control chart figures (default: True)
     """
-    import pandas as pd
-
     columns = config.get("columns")
     column = config.get("column")
     subgroup_size = config.get("subgroup_size")
     labels_col = config.get("labels_column")
+    include_series = config.get("include_series", True)
+    include_charts = config.get("include_charts", True)
 
     warnings: list[str] = []
 
@@ -200,13 +432,13 @@ def xbar_r_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         if len(subgroup_cols) < 2:
             return AnalysisResult(test_type="xbar_r_chart", test_category="spc", success=False,
                                   summary={}, details={"error": "Need at least 2 measurement columns"})
-        subgroups = df[subgroup_cols].dropna().values.astype(float)
+        subgroups, _ = _float_values(df[subgroup_cols])
         subgroup_size = subgroups.shape[1]
     elif column and column in df.columns:
         if not subgroup_size or subgroup_size < 2:
             return AnalysisResult(test_type="xbar_r_chart", test_category="spc", success=False,
                                   summary={}, details={"error": "subgroup_size must be >= 2"})
-        series = df[column].dropna().astype(float).values
+        series, _ = _float_values(df[column])
         n_complete = len(series) // subgroup_size * subgroup_size
         if n_complete < subgroup_size * 2:
             return AnalysisResult(test_type="xbar_r_chart", test_category="spc", success=False,
@@ -221,47 +453,70 @@ def xbar_r_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
                               summary={}, details={"error": f"Subgroup size {subgroup_size} not supported (2-10)"})
 
     constants = _XBAR_R_CONSTANTS[subgroup_size]
+    a2, d3, d4, d2 = constants["A2"], constants["D3"], constants["D4"], constants["d2"]
     k = len(subgroups)  # number of subgroups
 
-    # Subgroup means and ranges
-    xbar = np.mean(subgroups, axis=1)
-    r = np.ptp(subgroups, axis=1)  # max - min per subgroup
+    # Subgroup means and ranges (max - min per subgroup)
+    xbar, r = _subgroup_stats(subgroups)
 
     xbar_bar = float(np.mean(xbar))
     r_bar = float(np.mean(r))
 
-    # Control limits
-    xbar_ucl = xbar_bar + constants["A2"] * r_bar
-    xbar_lcl = xbar_bar - constants["A2"] * r_bar
-    r_ucl = constants["D4"] * r_bar
-    r_lcl = constants["D3"] * r_bar
+    # Control limits (A2 * R-bar is the 3-sigma half-width of the X-bar chart)
+    xbar_half_width = a2 * r_bar
+    xbar_ucl = xbar_bar + xbar_half_width
+    xbar_lcl = xbar_bar - xbar_half_width
+    r_ucl = d4 * r_bar
+    r_lcl = d3 * r_bar
 
-    sigma_est = r_bar / constants["d2"]
+    sigma_est = r_bar / d2
 
     labels = None
-    if labels_col and labels_col in df.columns:
-        labels = df[labels_col].dropna().astype(str).tolist()[:k]
-
-    xbar_violations = _detect_violations(xbar.tolist(), xbar_bar, xbar_ucl, xbar_lcl)
-    r_violations = _detect_violations(r.tolist(), r_bar, r_ucl, r_lcl)
+    if include_charts and labels_col and labels_col in df.columns:
+        # First k non-missing labels; only those k are stringified
+        label_series = df[labels_col]
+        head = label_series.iloc[:k]
+        if head.isna().any():
+            head = label_series.dropna().iloc[:k]
+        labels = head.astype(str).tolist()
+
+    xbar_violations = _detect_violations(xbar, xbar_bar, xbar_ucl, xbar_lcl)
+    r_violations = _detect_violations(r, r_bar, r_ucl, r_lcl)
+    # Zone tests use the standard error of the subgroup means
+    xbar_rules = _nelson_rules(xbar, xbar_bar, xbar_half_width / 3)
 
     if xbar_violations:
         warnings.append(f"{len(xbar_violations)} subgroup(s) out of control on X-bar chart")
     if r_violations:
         warnings.append(f"{len(r_violations)} subgroup(s) out of control on R chart")
+    if rule_warning := _nelson_warning(xbar_rules, "X-bar chart"):
+        warnings.append(rule_warning)
+
+    xbar_list = xbar.tolist() if include_charts or include_series else None
+    r_list = r.tolist() if include_charts or include_series else None
 
     chart_list = [
         chart_module.control_chart(
-            values=xbar.tolist(), center_line=xbar_bar, ucl=xbar_ucl, lcl=xbar_lcl,
+            values=xbar_list, center_line=xbar_bar, ucl=xbar_ucl, lcl=xbar_lcl,
             title=f"X-bar Chart (n={subgroup_size})", yaxis_title="Subgroup Mean",
             point_labels=labels, violations=xbar_violations,
         ),
         chart_module.control_chart(
-            values=r.tolist(), center_line=r_bar, ucl=r_ucl, lcl=r_lcl,
+            values=r_list, center_line=r_bar, ucl=r_ucl, lcl=r_lcl,
             title=f"R Chart (n={subgroup_size})", yaxis_title="Subgroup Range",
             point_labels=labels, violations=r_violations,
         ),
-    ]
+    ] if include_charts else []
+
+    details = {
+        "constants_used": constants,
+        "xbar_violation_indices": xbar_violations,
+        "r_violation_indices": r_violations,
+        "xbar_nelson_rule_indices": xbar_rules,
+    }
+    if include_series:
+        details["subgroup_means"] = xbar_list
+        details["subgroup_ranges"] = r_list
 
     summary = {
         "xbar_bar": xbar_bar,
@@ -283,13 +538,7 @@ def xbar_r_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         test_category="spc",
         success=True,
         summary=summary,
-        details={
-            "subgroup_means": xbar.tolist(),
-            "subgroup_ranges": r.tolist(),
-            "constants_used": constants,
-            "xbar_violation_indices": xbar_violations,
-            "r_violation_indices": r_violations,
-        },
+        details=details,
         charts=chart_list,
         interpretation_context={
             "test_name": "X-bar/R Control Chart",
@@ -316,22 +565,24 @@ def p_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         OR
         defects_column: str      — column with defectives
         sample_size: int         — constant sample size
+        include_series: bool     — return the per-sample series in details (default: True)
+        include_charts: bool     — build the control chart figures (default: True)
     """
-    import pandas as pd
-
     defects_col = config.get("defects_column")
     size_col = config.get("sample_size_column")
     const_size = config.get("sample_size")
+    include_series = config.get("include_series", True)
+    include_charts = config.get("include_charts", True)
 
     if not defects_col or defects_col not in df.columns:
         return AnalysisResult(test_type="p_chart", test_category="spc", success=False,
                               summary={}, details={"error": f"Column '{defects_col}' not found"})
 
-    defects = df[defects_col].dropna().astype(float).values
+    defects, _ = _float_values(df[defects_col])
     n = len(defects)
 
     if size_col and size_col in df.columns:
-        sizes = df[size_col].dropna().astype(float).values[:n]
+        sizes = _float_values(df[size_col])[0][:n]
     elif const_size:
         sizes = np.full(n, const_size, dtype=float)
     else:
@@ -342,30 +593,40 @@ def p_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="p_chart", test_category="spc", success=False,
                               summary={}, details={"error": "Need at least 2 samples"})
 
-    proportions = defects / sizes
+    # One division pass; proportions and limits multiply by the reciprocal
+    inv_sizes = 1.0 / sizes
+    proportions = defects * inv_sizes
     p_bar = float(np.sum(defects) / np.sum(sizes))
 
-    # Variable control limits (per sample)
-    ucl_arr = p_bar + 3 * np.sqrt(p_bar * (1 - p_bar) / sizes)
-    lcl_arr = np.maximum(0, p_bar - 3 * np.sqrt(p_bar * (1 - p_bar) / sizes))
+    # Variable control limits (per sample), one 3-sigma half-width array
+    half_width = 3 * np.sqrt(p_bar * (1 - p_bar) * inv_sizes)
+    ucl_arr = p_bar + half_width
+    lcl_arr = np.maximum(0, p_bar - half_width)
 
     # For charting, use average limits
     avg_size = float(np.mean(sizes))
-    ucl = p_bar + 3 * np.sqrt(p_bar * (1 - p_bar) / avg_size)
-    lcl = max(0, p_bar - 3 * np.sqrt(p_bar * (1 - p_bar) / avg_size))
+    avg_half_width = 3 * _scalar_sqrt(p_bar * (1 - p_bar) / avg_size)
+    ucl = p_bar + avg_half_width
+    lcl = max(0, p_bar - avg_half_width)
 
-    violations = [i for i in range(n) if proportions[i] > ucl_arr[i] or proportions[i] < lcl_arr[i]]
+    violations = _detect_violations(proportions, p_bar, ucl_arr, lcl_arr)
     warnings: list[str] = []
     if violations:
         warnings.append(f"{len(violations)} sample(s) out of control")
 
+    proportions_list = proportions.tolist() if include_charts or include_series else None
+
     chart_list = [
         chart_module.control_chart(
-            values=proportions.tolist(), center_line=p_bar, ucl=ucl, lcl=lcl,
+            values=proportions_list, center_line=p_bar, ucl=ucl, lcl=lcl,
             title="P Chart — Proportion Defective", yaxis_title="Proportion",
             violations=violations,
         ),
-    ]
+    ] if include_charts else []
+
+    details = {"violation_indices": violations}
+    if include_series:
+        details["proportions"] = proportions_list
 
     summary = {
         "p_bar": p_bar,
@@ -380,7 +641,7 @@ def p_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     return AnalysisResult(
         test_type="p_chart", test_category="spc", success=True,
         summary=summary,
-        details={"proportions": proportions.tolist(), "violation_indices": violations},
+        details=details,
         charts=chart_list,
         interpretation_context={
             "test_name": "P Chart (Proportion Defective)",
@@ -401,11 +662,13 @@ def np_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     Config:
         defects_column: str  — column with defective counts
         sample_size: int     — constant sample size
+        include_series: bool — return the per-sample series in details (default: True)
+        include_charts: bool — build the control chart figures (default: True)
     """
-    import pandas as pd
-
     defects_col = config.get("defects_column")
     sample_size = config.get("sample_size")
+    include_series = config.get("include_series", True)
+    include_charts = config.get("include_charts", True)
 
     if not defects_col or defects_col not in df.columns:
         return AnalysisResult(test_type="np_chart", test_category="spc", success=False,
@@ -414,7 +677,7 @@ def np_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="np_chart", test_category="spc", success=False,
                               summary={}, details={"error": "sample_size is required"})
 
-    defects = df[defects_col].dropna().astype(float).values
+    defects, _ = _float_values(df[defects_col])
     n = len(defects)
 
     if n < 2:
@@ -424,21 +687,28 @@ def np_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     np_bar = float(np.mean(defects))
     p_bar = np_bar / sample_size
 
-    ucl = np_bar + 3 * np.sqrt(np_bar * (1 - p_bar))
-    lcl = max(0, np_bar - 3 * np.sqrt(np_bar * (1 - p_bar)))
+    half_width = 3 * _scalar_sqrt(np_bar * (1 - p_bar))
+    ucl = np_bar + half_width
+    lcl = max(0, np_bar - half_width)
 
-    violations = _detect_violations(defects.tolist(), np_bar, ucl, lcl)
+    violations = _detect_violations(defects, np_bar, ucl, lcl)
     warnings: list[str] = []
     if violations:
         warnings.append(f"{len(violations)} sample(s) out of control")
 
+    defects_list = defects.tolist() if include_charts or include_series else None
+
     chart_list = [
         chart_module.control_chart(
-            values=defects.tolist(), center_line=np_bar, ucl=ucl, lcl=lcl,
+            values=defects_list, center_line=np_bar, ucl=ucl, lcl=lcl,
             title="NP Chart — Count Defective", yaxis_title="Defective Count",
             violations=violations,
         ),
-    ]
+    ] if include_charts else []
+
+    details = {"violation_indices": violations}
+    if include_series:
+        details["defects"] = defects_list
 
     return AnalysisResult(
         test_type="np_chart", test_category="spc", success=True,
@@ -447,7 +717,7 @@ def np_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
             "sample_size": sample_size, "num_samples": n,
             "violations": len(violations), "in_control": len(violations) == 0,
         },
-        details={"defects": defects.tolist(), "violation_indices": violations},
+        details=details,
         charts=chart_list,
         interpretation_context={
             "test_name": "NP Chart",
@@ -466,17 +736,19 @@ def np_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
 def c_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
     """
     Config:
-        column: str  — column with defect counts per unit
+        column: str          — column with defect counts per unit
+        include_series: bool — return the per-unit series in details (default: True)
+        include_charts: bool — build the control chart figures (default: True)
     """
-    import pandas as pd
-
     column = config.get("column")
+    include_series = config.get("include_series", True)
+    include_charts = config.get("include_charts", True)
 
     if not column or column not in df.columns:
         return AnalysisResult(test_type="c_chart", test_category="spc", success=False,
                               summary={}, details={"error": f"Column '{column}' not found"})
 
-    counts = df[column].dropna().astype(float).values
+    counts, _ = _float_values(df[column])
     n = len(counts)
 
     if n < 2:
@@ -484,21 +756,28 @@ def c_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
                               summary={}, details={"error": "Need at least 2 observations"})
 
     c_bar = float(np.mean(counts))
-    ucl = c_bar + 3 * np.sqrt(c_bar)
-    lcl = max(0, c_bar - 3 * np.sqrt(c_bar))
+    half_width = 3 * _scalar_sqrt(c_bar)
+    ucl = c_bar + half_width
+    lcl = max(0, c_bar - half_width)
 
-    violations = _detect_violations(counts.tolist(), c_bar, ucl, lcl)
+    violations = _detect_violations(counts, c_bar, ucl, lcl)
     warnings: list[str] = []
     if violations:
         warnings.append(f"{len(violations)} unit(s) out of control")
 
+    counts_list = counts.tolist() if include_charts or include_series else None
+
     chart_list = [
         chart_module.control_chart(
-            values=counts.tolist(), center_line=c_bar, ucl=ucl, lcl=lcl,
+            values=counts_list, center_line=c_bar, ucl=ucl, lcl=lcl,
             title=f"C Chart — {column}", yaxis_title="Defect Count",
             violations=violations,
         ),
-    ]
+    ] if include_charts else []
+
+    details = {"violation_indices": violations}
+    if include_series:
+        details["counts"] = counts_list
 
     return AnalysisResult(
         test_type="c_chart", test_category="spc", success=True,
@@ -506,7 +785,7 @@ def c_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
             "c_bar": c_bar, "ucl": ucl, "lcl": lcl, "num_units": n,
             "violations": len(violations), "in_control": len(violations) == 0,
         },
-        details={"counts": counts.tolist(), "violation_indices": violations},
+        details=details,
         charts=chart_list,
         interpretation_context={
             "test_name": "C Chart (Defects per Unit)",
@@ -530,22 +809,24 @@ def u_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         OR
         defects_column: str       — column with total defects
         units: int                — constant number of units
+        include_series: bool      — return the per-sample series in details (default: True)
+        include_charts: bool      — build the control chart figures (default: True)
     """
-    import pandas as pd
-
     defects_col = config.get("defects_column")
     units_col = config.get("units_column")
     const_units = config.get("units")
+    include_series = config.get("include_series", True)
+    include_charts = config.get("include_charts", True)
 
     if not defects_col or defects_col not in df.columns:
         return AnalysisResult(test_type="u_chart", test_category="spc", success=False,
                               summary={}, details={"error": f"Column '{defects_col}' not found"})
 
-    defects = df[defects_col].dropna().astype(float).values
+    defects, _ = _float_values(df[defects_col])
     n = len(defects)
 
     if units_col and units_col in df.columns:
-        units = df[units_col].dropna().astype(float).values[:n]
+        units = _float_values(df[units_col])[0][:n]
     elif const_units:
         units = np.full(n, const_units, dtype=float)
     else:
@@ -556,29 +837,39 @@ def u_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
         return AnalysisResult(test_type="u_chart", test_category="spc", success=False,
                               summary={}, details={"error": "Need at least 2 samples"})
 
-    u_values = defects / units
+    # One division pass; rates and limits multiply by the reciprocal
+    inv_units = 1.0 / units
+    u_values = defects * inv_units
     u_bar = float(np.sum(defects) / np.sum(units))
 
     avg_units = float(np.mean(units))
-    ucl = u_bar + 3 * np.sqrt(u_bar / avg_units)
-    lcl = max(0, u_bar - 3 * np.sqrt(u_bar / avg_units))
+    avg_half_width = 3 * _scalar_sqrt(u_bar / avg_units)
+    ucl = u_bar + avg_half_width
+    lcl = max(0, u_bar - avg_half_width)
 
     # Variable limits
-    ucl_arr = u_bar + 3 * np.sqrt(u_bar / units)
-    lcl_arr = np.maximum(0, u_bar - 3 * np.sqrt(u_bar / units))
+    half_width = 3 * np.sqrt(u_bar * inv_units)
+    ucl_arr = u_bar + half_width
+    lcl_arr = np.maximum(0, u_bar - half_width)
 
-    violations = [i for i in range(n) if u_values[i] > ucl_arr[i] or u_values[i] < lcl_arr[i]]
+    violations = _detect_violations(u_values, u_bar, ucl_arr, lcl_arr)
     warnings: list[str] = []
     if violations:
         warnings.append(f"{len(violations)} sample(s) out of control")
 
+    u_values_list = u_values.tolist() if include_charts or include_series else None
+
     chart_list = [
         chart_module.control_chart(
-            values=u_values.tolist(), center_line=u_bar, ucl=ucl, lcl=lcl,
+            values=u_values_list, center_line=u_bar, ucl=ucl, lcl=lcl,
             title="U Chart — Defects per Unit", yaxis_title="Rate (defects/unit)",
             violations=violations,
         ),
-    ]
+    ] if include_charts else []
+
+    details = {"violation_indices": violations}
+    if include_series:
+        details["u_values"] = u_values_list
 
     return AnalysisResult(
         test_type="u_chart", test_category="spc", success=True,
@@ -587,7 +878,7 @@ def u_chart(df: "pd.DataFrame", config: dict) -> AnalysisResult:
             "num_samples": n, "avg_units": avg_units,
             "violations": len(violations), "in_control": len(violations) == 0,
         },
-        details={"u_values": u_values.tolist(), "violation_indices": violations},
+        details=details,
         charts=chart_list,
         interpretation_context={
             "test_name": "U Chart (Defects per Unit, Variable Size)",
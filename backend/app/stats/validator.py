@@ -25,6 +25,7 @@ from pydantic import BaseModel, Field
 from scipy import stats as scipy_stats
 
 from app.stats import AnalysisResult
+from app.stats.datasets import drop_incomplete
 
 
 # ---------------------------------------------------------------------------
@@ -166,6 +167,11 @@ _TEST_REQUIREMENTS: dict[str, dict[str, Any]] = {
         "required_config": ["x_column", "y_column"],
         "assumes_normality": True,
     },
+    "simple_regression_batch": {
+        "min_samples": 10,
+        "requires_numeric": True,
+        "required_config": ["x_columns", "y_column"],
+    },
     "multiple_regression": {
         "min_samples": 20,
         "requires_numeric": True,
@@ -184,6 +190,11 @@ _TEST_REQUIREMENTS: dict[str, dict[str, Any]] = {
         "requires_numeric": True,
         "required_config": ["column"],
     },
+    "i_mr_chart_batch": {
+        "min_samples": 20,
+        "requires_numeric": True,
+        "required_config": ["columns"],
+    },
     "xbar_r_chart": {
         "min_samples": 20,
         "requires_numeric": True,
@@ -388,7 +399,9 @@ def validate_inputs(
 # Output validation
 # ---------------------------------------------------------------------------
 
-def validate_outputs(test_type: str, result: AnalysisResult) -> ValidationReport:
+def validate_outputs(
+    test_type: str, result: AnalysisResult, configuration: dict | None = None,
+) -> ValidationReport:
     """Validate statistical test outputs for sanity."""
     findings: list[ValidationFinding] = []
     recommendations: list[str] = []
@@ -487,7 +500,8 @@ def validate_outputs(test_type: str, result: AnalysisResult) -> ValidationReport
                    "i_mr_chart", "xbar_r_chart", "p_chart", "np_chart", "c_chart", "u_chart",
                    "capability_normal", "capability_nonnormal", "simple_regression",
                    "correlation", "doe_analysis"}
-    if test_type in chart_tests and result.success and not result.charts:
+    charts_requested = (configuration or {}).get("include_charts", True)
+    if test_type in chart_tests and charts_requested and result.success and not result.charts:
         findings.append(ValidationFinding(
             severity=Severity.WARNING,
             category=FindingCategory.OUTPUT_RANGE,
@@ -643,7 +657,7 @@ def validate_assumptions(
         if len(valid_cols) >= 2:
             try:
                 from statsmodels.stats.outliers_influence import variance_inflation_factor
-                X = df[valid_cols].dropna()
+                X = drop_incomplete(df[valid_cols])
                 if len(X) > len(valid_cols) + 1:
                     X_with_const = X.copy()
                     X_with_const["_const"] = 1
@@ -702,7 +716,7 @@ def run_full_validation(
     input_report = validate_inputs(test_type, configuration, dataset_summary, df)
 
     # Layer 1b: Output checks
-    output_report = validate_outputs(test_type, result)
+    output_report = validate_outputs(test_type, result, configuration)
 
     # Layer 1c: Assumption checks
     assumption_report = validate_assumptions(test_type, df, configuration)
@@ -0,0 +1,96 @@
+"""Comparison test functions — two-sample t variance handling and two-way ANOVA."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+import statsmodels.formula.api as smf
+from scipy import stats as sp_stats
+
+from app.stats.comparison import two_sample_t, two_way_anova
+
+CONFIG = {"y_column": "y", "factor_a": "a", "factor_b": "b"}
+T_CONFIG = {"y_column": "y", "x_column": "g"}
+
+
+def _two_groups(first: np.ndarray, second: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame({
+        "y": np.concatenate([first, second]),
+        "g": ["p"] * len(first) + ["q"] * len(second),
+    })
+
+
+def test_two_sample_t_unequal_sizes_use_welch():
+    """Smaller group with the larger variance (ratio < 4): Levene runs and picks Welch."""
+    rng = np.random.default_rng(1)
+    df = _two_groups(rng.normal(0, 1.85, 30), rng.normal(0, 1, 60))
+
+    result = two_sample_t(df, T_CONFIG)
+    assert result.success
+    assert result.summary["equal_var"] is False
+    assert any(w.startswith("Levene's test indicates unequal variances") for w in result.warnings)
+    welch = sp_stats.ttest_ind(df["y"][:30], df["y"][30:], equal_var=False)
+    assert result.summary["p_value"] == pytest.approx(welch.pvalue, rel=1e-12)
+
+
+def test_two_sample_t_equal_sizes_skip_levene(monkeypatch):
+    """Large equal-size groups with a variance ratio under 4 use the pooled test directly."""
+    rng = np.random.default_rng(2)
+    df = _two_groups(rng.normal(0, 1.5, 40), rng.normal(0, 1, 40))
+
+    def no_levene(*args, **kwargs):
+        raise AssertionError("Levene should be skipped")
+
+    monkeypatch.setattr(sp_stats, "levene", no_levene)
+    result = two_sample_t(df, T_CONFIG)
+    assert result.success
+    assert result.summary["equal_var"] is True
+
+
+def test_two_way_anova_matches_statsmodels():
+    """Unbalanced 3x2 layout reproduces anova_lm(typ=2)."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.choice(["p", "q", "r"], 50), "b": rng.choice(["u", "v"], 50)})
+    df["y"] = (df["a"] == "r") * 1.5 + (df["b"] == "v") * 0.5 + rng.normal(size=50)
+
+    result = two_way_anova(df, CONFIG)
+    assert result.success
+    table = result.summary["anova_table"]
+
+    expected = sm.stats.anova_lm(smf.ols("y ~ C(a) + C(b) + C(a):C(b)", data=df).fit(), typ=2)
+    for term, row in zip(table, expected.itertuples()):
+        assert table[term]["sum_sq"] == pytest.approx(row.sum_sq, rel=1e-9)
+        assert table[term]["df"] == row.df
+    assert table["C(Q('a'))"]["PR(>F)"] == pytest.approx(expected.loc["C(a)", "PR(>F)"], rel=1e-7)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_two_way_anova_exact_additive_fit(seed: int):
+    """Balanced 2x2 with an exactly additive response: no negative SS or F."""
+    rng = np.random.default_rng(seed)
+    a = np.tile([0, 1, 0, 1], 3)
+    b = np.tile([0, 0, 1, 1], 3)
+    df = pd.DataFrame({"y": 5 + a * rng.normal() + b * rng.normal(), "a": a, "b": b})
+
+    result = two_way_anova(df, CONFIG)
+    assert result.success
+    table = result.summary["anova_table"]
+    assert table["Residual"]["sum_sq"] >= 0
+    for row in table.values():
+        assert row["F"] is None or row["F"] >= 0
+        assert row["PR(>F)"] is None or 0 <= row["PR(>F)"] <= 1
+
+
+def test_two_way_anova_zero_residual():
+    """A fit with exactly zero residual reports untestable effects, not an error."""
+    a = np.tile([0, 1, 0, 1], 3)
+    b = np.tile([0, 0, 1, 1], 3)
+    # Coefficients for which the least-squares residual rounds to exactly 0.0
+    coef_a, coef_b = np.random.default_rng(0).normal(size=(18, 2))[-1]
+    df = pd.DataFrame({"y": 5 + a * coef_a + b * coef_b, "a": a, "b": b})
+
+    result = two_way_anova(df, CONFIG)
+    assert result.success
+    table = result.summary["anova_table"]
+    assert table["Residual"]["sum_sq"] == 0.0
+    assert all(row["F"] is None for row in table.values())
@@ -0,0 +1,62 @@
+"""DOE analysis tests — Yates fast path against the general factorial ANOVA."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.stats.doe import _factorial_anova, _str_levels, _yates_anova, factorial_anova
+
+
+def _two_level_design(k: int, replicates: int, seed: int = 0) -> np.ndarray:
+    """Shuffled 0/1 runs of a replicated 2^k full factorial."""
+    cells = (np.arange(2 ** k)[:, None] >> np.arange(k)) & 1
+    runs = np.tile(cells, (replicates, 1))
+    return runs[np.random.default_rng(seed).permutation(len(runs))]
+
+
+def _factors(runs: np.ndarray) -> dict[str, pd.Series]:
+    return {name: _str_levels(pd.Series(runs[:, i])) for i, name in enumerate("ABCD"[:runs.shape[1]])}
+
+
+@pytest.mark.parametrize("k,replicates", [(2, 3), (3, 2), (4, 2)])
+def test_yates_matches_general_fit(k: int, replicates: int):
+    """Balanced two-level designs give the same table from both fits."""
+    runs = _two_level_design(k, replicates)
+    rng = np.random.default_rng(k)
+    y = runs @ rng.normal(size=k) + rng.normal(size=len(runs))
+    factors = _factors(runs)
+
+    fast = _yates_anova(y, factors, 0.05)
+    general = _factorial_anova(y, factors, 0.05)
+    assert fast is not None
+
+    effects, r2, adj_r2, ssr, df_resid = fast
+    assert r2 == pytest.approx(general[1], rel=1e-9)
+    assert adj_r2 == pytest.approx(general[2], rel=1e-9)
+    assert ssr == pytest.approx(general[3], rel=1e-9)
+    assert df_resid == general[4]
+    assert effects.keys() == general[0].keys()
+    for term, row in effects.items():
+        for key in ("sum_sq", "F", "p_value"):
+            assert row[key] == pytest.approx(general[0][term][key], rel=1e-7, abs=1e-12)
+        assert row["significant"] == general[0][term]["significant"]
+
+
+def test_yates_declines_unbalanced_design():
+    """A missing run sends the design to the general fit."""
+    runs = _two_level_design(3, 2)[:-1]
+    y = runs.sum(axis=1).astype(float)
+    assert _yates_anova(y, _factors(runs), 0.05) is None
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_exact_additive_response_has_no_negative_residual(seed: int):
+    """An exact additive fit must not produce a negative residual SS or F."""
+    runs = _two_level_design(3, 2, seed)
+    y = 5 + runs @ np.random.default_rng(seed).normal(size=3)
+
+    effects, _, _, ssr, _ = factorial_anova(y, _factors(runs), 0.05)
+    assert ssr >= 0
+    for term in ("A", "B", "C"):
+        assert effects[term]["F"] is not None and effects[term]["F"] > 0
+        assert effects[term]["significant"]
@@ -0,0 +1,48 @@
+"""Stats process pool — worker-side dataset loading and pool lifecycle."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.stats.descriptive import descriptive_summary
+from app.stats.pool import discard_process_pool, get_process_pool, run_on_dataset, shutdown_process_pool
+
+
+def _exit_worker(df: pd.DataFrame, config: dict) -> None:
+    os._exit(9)
+
+
+@pytest.fixture
+def dataset(tmp_path) -> dict:
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"y": np.arange(12.0)}).to_csv(path, index=False)
+    return {"file_path": str(path)}
+
+
+def test_run_on_dataset_loads_in_process(dataset: dict):
+    """The worker entry point rebuilds the frame from the dataset dict."""
+    result, elapsed_ms = run_on_dataset(descriptive_summary, dataset, {"columns": ["y"]})
+    assert result.success
+    assert result.summary["n"] == 12
+    assert elapsed_ms >= 0
+
+
+def test_broken_pool_is_replaced(dataset: dict):
+    """After a worker dies, discarding the pool lets the next batch run."""
+    pool = get_process_pool()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(run_on_dataset, _exit_worker, dataset, {}).result()
+        discard_process_pool(pool)
+
+        fresh = get_process_pool()
+        assert fresh is not pool
+        result, _ = fresh.submit(run_on_dataset, descriptive_summary, dataset, {"columns": ["y"]}).result()
+        assert result.success
+    finally:
+        shutdown_process_pool()
+    assert get_process_pool() is not pool
+    shutdown_process_pool()
@@ -0,0 +1,70 @@
+"""Regression tests — batched simple fits and the direct Newton logit."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+from app.stats.regression import _logit_newton, simple_regression, simple_regression_batch
+
+
+@pytest.fixture
+def predictors() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(60, 3)), columns=["x1", "x2", "x3"])
+    df["y"] = 2.0 + 1.5 * df["x1"] - 0.3 * df["x3"] + rng.normal(size=60)
+    return df
+
+
+def test_simple_regression_batch_matches_single_fits(predictors: pd.DataFrame):
+    """Each per-predictor fit equals simple_regression on the same rows."""
+    x_cols = ["x1", "x2", "x3"]
+    batch = simple_regression_batch(predictors, {"y_column": "y", "x_columns": x_cols})
+    assert batch.success
+    assert batch.summary["best_predictor"] == "x1"
+
+    for col in x_cols:
+        single = simple_regression(predictors, {"y_column": "y", "x_column": col, "include_charts": False})
+        fit = batch.details["fits"][col]
+        for key in ("intercept", "slope", "slope_p_value", "slope_ci_lower", "slope_ci_upper",
+                    "r_squared", "significant"):
+            assert fit[key] == pytest.approx(single.summary[key], rel=1e-9)
+        assert fit["slope_std_err"] == pytest.approx(single.details["coefficients"][col]["std_err"], rel=1e-9)
+
+
+def test_simple_regression_batch_skips_constant_predictor(predictors: pd.DataFrame):
+    predictors["flat"] = 4.0
+    result = simple_regression_batch(predictors, {"y_column": "y", "x_columns": ["x1", "flat"]})
+    assert result.success
+    assert result.details["x_columns"] == ["x1"]
+    assert result.warnings == ["X column 'flat' is constant and was skipped"]
+
+
+def test_simple_regression_batch_uses_rows_complete_across_predictors(predictors: pd.DataFrame):
+    predictors.loc[[3, 10], "x2"] = np.nan
+    result = simple_regression_batch(predictors, {"y_column": "y", "x_columns": ["x1", "x2"]})
+    single = simple_regression(predictors.drop(index=[3, 10]),
+                               {"y_column": "y", "x_column": "x1", "include_charts": False})
+    assert result.summary["n"] == 58
+    assert result.details["fits"]["x1"]["slope"] == pytest.approx(single.summary["slope"], rel=1e-12)
+
+
+def test_logit_newton_matches_statsmodels():
+    rng = np.random.default_rng(1)
+    X = sm.add_constant(rng.normal(size=(200, 2)))
+    y = (rng.random(200) < 1 / (1 + np.exp(-(X @ [-0.5, 1.2, -0.8])))).astype(float)
+
+    fit = _logit_newton(X, y)
+    assert fit is not None
+    model = sm.Logit(y, X).fit(disp=0)
+    np.testing.assert_allclose(fit["params"], model.params, rtol=1e-7)
+    np.testing.assert_allclose(fit["bse"], model.bse, rtol=1e-6)
+    np.testing.assert_allclose(fit["predicted"], model.predict(X), rtol=1e-7)
+    for key in ("llf", "prsquared", "aic", "bic"):
+        assert fit[key] == pytest.approx(getattr(model, key), rel=1e-9)
+
+
+def test_logit_newton_declines_separated_data():
+    """Perfect separation has no finite optimum, so the caller falls back."""
+    x = np.arange(20.0)
+    assert _logit_newton(sm.add_constant(x), (x >= 10).astype(float)) is None
@@ -0,0 +1,97 @@
+"""SPC tests — Nelson rules 2-8 and the batched I-MR chart."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.stats.spc import _nelson_rules, i_mr_chart, i_mr_chart_batch
+
+RULES = [f"rule_{i}" for i in range(2, 9)]
+
+# One series per rule, in sigma units about a centre line of 0, built so that
+# only that rule signals and at exactly one point.
+NELSON_CASES = {
+    # 9 points above the centre line: indices 1-9
+    "rule_2": ([-0.5] + [0.5] * 9 + [-0.5], 9),
+    # 6 points steadily increasing: indices 1-6
+    "rule_3": ([0.0, -0.5, -0.3, -0.1, 0.1, 0.3, 0.5, 0.0], 6),
+    # 14 points alternating up and down: indices 0-13
+    "rule_4": ([0.5, -0.5] * 7, 13),
+    # 2 of 3 points beyond +2 sigma: indices 2 and 4
+    "rule_5": ([0.5, -0.5, 2.5, 0.5, 2.5, -0.5], 4),
+    # 4 of 5 points beyond +1 sigma: indices 1, 2, 4 and 5
+    "rule_6": ([-0.5, 1.5, 1.5, 0.5, 1.5, 1.5, -0.5], 5),
+    # 15 points within 1 sigma, with no alternation or long one-sided run
+    "rule_7": (np.resize([0.5, 0.5, -0.5, -0.5], 15).tolist(), 14),
+    # 8 points beyond 1 sigma on both sides: indices 0-7
+    "rule_8": ([1.5, -1.5] * 4, 7),
+}
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_nelson_rule_signals_at_pattern_end(rule: str):
+    """Each pattern signals its own rule at the point that completes it, and no other."""
+    values, index = NELSON_CASES[rule]
+    rules = _nelson_rules(np.asarray(values), 0.0, 1.0)
+    assert rules == {r: [index] if r == rule else [] for r in RULES}
+
+
+def test_nelson_rules_scale_with_centre_and_sigma():
+    """Zones are measured from the centre line in units of sigma."""
+    values, index = NELSON_CASES["rule_5"]
+    rules = _nelson_rules(10.0 + 0.2 * np.asarray(values), 10.0, 0.2)
+    assert rules["rule_5"] == [index]
+
+
+def test_nelson_rules_zero_sigma():
+    assert _nelson_rules(np.ones(20), 1.0, 0.0) == {}
+
+
+def test_i_mr_chart_reports_nelson_rules():
+    """The I chart runs the rules against its own centre line and sigma estimate."""
+    rng = np.random.default_rng(3)
+    values = np.concatenate([rng.normal(size=20), rng.normal(size=10) + 1.5])
+    result = i_mr_chart(pd.DataFrame({"x": values}), {"column": "x", "include_charts": False})
+    assert result.success
+
+    summary = result.summary
+    expected = _nelson_rules(values, summary["x_bar"], summary["sigma_estimate"])
+    assert result.details["i_nelson_rule_indices"] == expected
+    assert any(expected.values())
+    assert any(w.startswith("Nelson rule signals on Individuals chart") for w in result.warnings)
+
+
+def test_i_mr_chart_batch_matches_single_column():
+    """Per-column batch results equal separate i_mr_chart calls, each with its own missing rows."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.normal(size=40),
+        "b": rng.normal(5, 2, size=40),
+        "c": np.full(40, 2.5),
+    })
+    df.loc[[0, 7, 8], "a"] = np.nan
+    df.loc[[20, 39], "b"] = np.nan
+    df.loc[[5, 15], "b"] = [25.0, -15.0]
+
+    batch = i_mr_chart_batch(df, {"columns": ["a", "b", "c"], "include_charts": False})
+    assert batch.success
+    for col in ("a", "b", "c"):
+        single = i_mr_chart(df, {"column": col, "include_charts": False})
+        got = batch.details["columns"][col]
+        for key in ("x_bar", "mr_bar", "sigma_estimate", "i_ucl", "i_lcl", "mr_ucl"):
+            assert got[key] == pytest.approx(single.summary[key], rel=1e-12, abs=1e-12)
+        for key in ("n", "i_violations", "mr_violations", "in_control"):
+            assert got[key] == single.summary[key]
+        assert got["i_violation_indices"] == single.details["i_violation_indices"]
+        assert got["mr_violation_indices"] == single.details["mr_violation_indices"]
+
+    assert batch.details["columns"]["c"]["x_bar"] == 2.5
+    assert batch.summary["columns_out_of_control"] == ["b"]
+
+
+def test_i_mr_chart_batch_skips_short_columns():
+    df = pd.DataFrame({"a": np.arange(6.0), "b": [1.0] + [np.nan] * 5})
+    result = i_mr_chart_batch(df, {"columns": ["a", "b"], "include_charts": False})
+    assert result.success
+    assert list(result.details["columns"]) == ["a"]
+    assert result.warnings[0] == "Column 'b' has fewer than 2 observations and was skipped"